@@ -1,6 +1,23 @@
-import heapq
+import array
+import bisect
+import concurrent.futures
+import math
+import mmap
 import time
 import os  
+import sys
+
+try:
+    from colorama import just_fix_windows_console
+except ImportError: # colorama es opcional: sin él la consola de Windows puede no entender ANSI
+    ANSI_DISPONIBLE = os.name != 'nt'
+else:
+    # En la consola de Windows activa el procesamiento de secuencias ANSI (en otros sistemas no hace nada)
+    just_fix_windows_console()
+    ANSI_DISPONIBLE = True
+
+# Secuencias ANSI: limpiar la pantalla y llevar el cursor al inicio
+LIMPIAR_PANTALLA = "\x1b[2J\x1b[H"
 
 # El estado objetivo 
 ESTADO_FINAL = ((1, 2, 3, 4),
@@ -11,16 +28,37 @@ ESTADO_FINAL = ((1, 2, 3, 4),
 # Mapa precalculado de las posiciones finales de cada ficha para la heurística
 POSICIONES_FINALES = {ficha: (fila, col) for fila, fila_vals in enumerate(ESTADO_FINAL) for col, ficha in enumerate(fila_vals)}
 
+# Tabla precalculada DISTANCIAS_MANHATTAN[ficha][casilla] con casilla = fila * 4 + columna.
+# El espacio vacío no cuenta para la heurística, por eso su fila es toda de ceros.
+DISTANCIAS_MANHATTAN = tuple(
+    tuple(0 if ficha == 0 else abs(casilla // 4 - POSICIONES_FINALES[ficha][0]) + abs(casilla % 4 - POSICIONES_FINALES[ficha][1])
+          for casilla in range(16))
+    for ficha in range(16)
+)
+
 
 def limpiar_pantalla():
-    """Limpia la pantalla"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Limpia la pantalla con una secuencia ANSI, sin lanzar un proceso (cls si no hay ANSI)"""
+    if not sys.stdout.isatty():
+        return
+    if ANSI_DISPONIBLE:
+        sys.stdout.write(LIMPIAR_PANTALLA)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+def texto_ficha(num):
+    return f"{num:2}" if num != 0 else "  "
+
+def formatear_tablero(estado):
+    """El tablero como texto, con su marco, listo para escribirse de una vez"""
+    lineas = ["-" * 13]
+    lineas.extend("| " + " ".join(texto_ficha(num) for num in fila) + " |" for fila in estado)
+    lineas.append("-" * 13)
+    return "\n".join(lineas) + "\n"
 
 def imprimir_tablero(estado):
-    print("-" * 13)
-    for fila in estado:
-        print("|", " ".join(f"{num:2}" if num != 0 else "  " for num in fila), "|")
-    print("-" * 13)
+    sys.stdout.write(formatear_tablero(estado))
 
 def encontrar_posicion_vacia(estado):
     for i, fila in enumerate(estado):
@@ -40,7 +78,11 @@ def es_resolvible(estado):
     else:
         return fila_vacia_desde_abajo % 2 != 0
 
-def obtener_siguientes_estados(estado):
+def obtener_siguientes_con_ficha(estado):
+    """
+    Genera (estado, ficha_movida, casilla_origen, casilla_destino) por cada sucesor.
+    Las casillas van de 0 a 15 (fila * 4 + columna) para poder usar DISTANCIAS_MANHATTAN.
+    """
     siguientes = []
     fila_vacia, col_vacia = encontrar_posicion_vacia(estado)
     movimientos = [(-1, 0, 'Arriba'), (1, 0, 'Abajo'), (0, -1, 'Izquierda'), (0, 1, 'Derecha')]
@@ -52,34 +94,93 @@ def obtener_siguientes_estados(estado):
             ficha_movida = nuevo_estado_lista[nueva_fila][nueva_col]
             nuevo_estado_lista[fila_vacia][col_vacia] = ficha_movida
             nuevo_estado_lista[nueva_fila][nueva_col] = 0
-            siguientes.append(tuple(map(tuple, nuevo_estado_lista)))
+            siguientes.append((tuple(map(tuple, nuevo_estado_lista)), ficha_movida,
+                               nueva_fila * 4 + nueva_col, fila_vacia * 4 + col_vacia))
     return siguientes
 
+def obtener_siguientes_estados(estado):
+    return [siguiente for siguiente, _, _, _ in obtener_siguientes_con_ficha(estado)]
+
 # ==========#
 # ANIMACIÓN #
 # ==========#
-def animar_solucion(resultado):
+
+# Letra de cada movimiento del espacio vacío según cambia su casilla
+LETRAS_MOVIMIENTO = {-4: 'A', 4: 'B', -1: 'I', 1: 'D'} # Arriba, Abajo, Izquierda, Derecha
+
+def movimientos_como_texto(camino):
+    """Camino de tableros como cadena compacta de movimientos del espacio vacío, p. ej. 'AAIDB'"""
+    vacias = [fila * 4 + col for fila, col in map(encontrar_posicion_vacia, camino)]
+    return "".join(LETRAS_MOVIMIENTO[destino - origen] for origen, destino in zip(vacias, vacias[1:]))
+
+class RenderizadorTablero:
+    """
+    Dibuja la animación con secuencias ANSI. El primer cuadro se escribe completo y
+    los siguientes solo mueven el cursor a las casillas que cambiaron (dos por
+    movimiento) y al contador de pasos. Cada cuadro sale en una sola escritura.
+    """
+    # Líneas de la pantalla (empezando en 1) del contador de pasos y de la primera fila del tablero
+    LINEA_PASO = 3
+    LINEA_TABLERO = 5
+
+    def __init__(self, salida=None):
+        self.salida = salida or sys.stdout
+        self.anterior = None
+
+    def dibujar(self, estado, paso, total):
+        if self.anterior is None:
+            partes = [LIMPIAR_PANTALLA, "Resolviendo el 15-Puzzle...\n", f"\nPaso {paso} / {total}\n",
+                      formatear_tablero(estado)]
+        else:
+            partes = [f"\x1b[{self.LINEA_PASO};1H\x1b[2KPaso {paso} / {total}"]
+            for i in range(4):
+                for j in range(4):
+                    if estado[i][j] != self.anterior[i][j]:
+                        # Cada ficha ocupa 3 columnas después de "| "
+                        partes.append(f"\x1b[{self.LINEA_TABLERO + i};{3 + 3 * j}H{texto_ficha(estado[i][j])}")
+            # El cursor se deja debajo del marco inferior
+            partes.append(f"\x1b[{self.LINEA_TABLERO + 5};1H")
+        self.salida.write("".join(partes))
+        self.salida.flush()
+        self.anterior = estado
+
+def animar_solucion(resultado, salida=None):
+    """
+    En una terminal anima la solución redibujando solo lo que cambia. Si la salida no
+    es una terminal (un archivo o una tubería), escribe el resumen y los movimientos
+    como texto compacto, sin tableros ni pausas.
+    """
+    salida = salida or sys.stdout
     camino, tiempo, estados_explorados = resultado
     if not camino:
-        print("No se encontró una solución.")
+        salida.write("No se encontró una solución.\n")
         return
-    
-    print("Solución encontrada")
-    print(f"Total de movimientos: {len(camino) - 1}")
-    print(f"Estados explorados por A*: {estados_explorados}")
-    print(f"Tiempo de cálculo: {tiempo:.5f} segundos.")
-    print("\nIniciando animación en 3 segundos...")
+
+    resumen = ("Solución encontrada\n"
+               f"Total de movimientos: {len(camino) - 1}\n"
+               f"Estados explorados por A*: {estados_explorados}\n"
+               f"Tiempo de cálculo: {tiempo:.5f} segundos.\n")
+    if not salida.isatty():
+        salida.write(resumen + f"Movimientos: {movimientos_como_texto(camino)}\n")
+        return
+
+    salida.write(resumen + "\nIniciando animación en 3 segundos...\n")
+    salida.flush()
     time.sleep(3)
 
+    renderizador = RenderizadorTablero(salida)
     for i, estado in enumerate(camino):
-        limpiar_pantalla()
-        print("Resolviendo el 15-Puzzle...")
-        print(f"\nPaso {i} / {len(camino) - 1}")
-        imprimir_tablero(estado)
+        if ANSI_DISPONIBLE:
+            renderizador.dibujar(estado, i, len(camino) - 1)
+        else:
+            # Consola sin ANSI: se redibuja todo el cuadro después de limpiar con cls
+            limpiar_pantalla()
+            salida.write(f"Resolviendo el 15-Puzzle...\n\nPaso {i} / {len(camino) - 1}\n{formatear_tablero(estado)}")
+            salida.flush()
         # Pausa entre movimientos
         time.sleep(0.8)
     
-    print("\n¡Puzzle resuelto!")
+    salida.write("\n¡Puzzle resuelto!\n")
 
 # --------------#
 # ALGORITMO A*  #
@@ -102,39 +203,718 @@ def reconstruir_camino(camino_previo, estado_actual):
         camino_total.append(estado_actual)
     return list(reversed(camino_total))
 
-def resolver_con_a_estrella(estado_inicial):
+class ColaPorCubetas:
+    """
+    Cola de prioridad para f enteras y pequeñas: una cubeta por valor de f y,
+    dentro de cada una, una lista por valor de g. sacar() toma la f mínima y,
+    entre empates, la g más profunda, que suele estar más cerca de la meta.
+    Agregar y sacar cuestan O(1) amortizado en lugar del O(log n) del heap.
+    """
+    def __init__(self):
+        self.cubetas = [] # cubetas[f][g] -> lista de elementos
+        self.f_minima = 0
+        self.tamano = 0
+
+    def agregar(self, costo_f, costo_g, elemento):
+        while len(self.cubetas) <= costo_f:
+            self.cubetas.append([])
+        cubeta = self.cubetas[costo_f]
+        while len(cubeta) <= costo_g:
+            cubeta.append([])
+        cubeta[costo_g].append(elemento)
+        if costo_f < self.f_minima:
+            self.f_minima = costo_f
+        self.tamano += 1
+
+    def _cubeta_minima(self):
+        if not self.tamano:
+            raise IndexError("la cola está vacía")
+        costo_f = self.f_minima
+        while True:
+            cubeta = self.cubetas[costo_f]
+            # Se descartan las listas vacías del final para que la última sea la de mayor g
+            while cubeta and not cubeta[-1]:
+                cubeta.pop()
+            if cubeta:
+                break
+            costo_f += 1
+        self.f_minima = costo_f
+        return costo_f, cubeta
+
+    def ver(self):
+        """Como sacar(), pero sin quitar el elemento de la cola"""
+        costo_f, cubeta = self._cubeta_minima()
+        return costo_f, len(cubeta) - 1, cubeta[-1][-1]
+
+    def sacar(self):
+        """Devuelve (costo_f, costo_g, elemento) con la menor f y, a igual f, la mayor g"""
+        costo_f, cubeta = self._cubeta_minima()
+        self.tamano -= 1
+        return costo_f, len(cubeta) - 1, cubeta[-1].pop()
+
+    def __len__(self):
+        return self.tamano
+
+def resolver_con_a_estrella(estado_inicial, heuristica=None, observador=None, perimetro=None):
+    """
+    Por defecto usa la distancia Manhattan actualizada de forma incremental. Si se pasa
+    otra heurística (por ejemplo crear_heuristica_patrones()), se evalúa sobre el estado
+    empaquetado de cada sucesor. `observador` recibe los eventos de la búsqueda (ver
+    IA/instrumentacion.py). Con un `perimetro` (ver cargar_perimetro) la búsqueda se
+    detiene al sacar un estado del perímetro y completa el camino con el guardado.
+    """
     inicio_tiempo = time.time()
-    frontera = [(heuristica_manhattan(estado_inicial), estado_inicial)]
+    if heuristica is None:
+        costo_h_inicial = heuristica_manhattan(estado_inicial)
+    else:
+        costo_h_inicial = heuristica(empaquetar_estado(estado_inicial))
+    costo_f_inicial = costo_h_inicial
+    if perimetro is not None:
+        costo_f_inicial = perimetro.estimar(empaquetar_estado(estado_inicial), costo_h_inicial)
+    # Cada nodo de la frontera lleva su h para calcular la de sus hijos en O(1)
+    frontera = ColaPorCubetas()
+    frontera.agregar(costo_f_inicial, 0, (estado_inicial, costo_h_inicial))
     camino_previo = {estado_inicial: None}
     costo_g = {estado_inicial: 0}
     estados_explorados = 0
 
     while frontera:
-        _, estado_actual = heapq.heappop(frontera)
+        costo_f_actual, costo_g_actual, (estado_actual, costo_h_actual) = frontera.sacar()
+        if costo_g_actual > costo_g[estado_actual]:
+            if observador is not None:
+                observador.podar(estado_actual)
+            continue # Entrada obsoleta: el estado ya se alcanzó con menor costo
         estados_explorados += 1
+        if observador is not None:
+            observador.expandir(estado_actual, frontera, costo_g)
+
+        # Solo los estados del perímetro entran a la cola con f - g <= radio
+        if perimetro is not None and costo_f_actual - costo_g_actual <= perimetro.radio:
+            fin_tiempo = time.time()
+            cola = [desempaquetar_estado(codigo) for codigo in perimetro.cola(empaquetar_estado(estado_actual))]
+            camino = reconstruir_camino(camino_previo, estado_actual) + cola
+            return camino, fin_tiempo - inicio_tiempo, estados_explorados
 
         if estado_actual == ESTADO_FINAL:
             fin_tiempo = time.time()
             camino = reconstruir_camino(camino_previo, estado_actual)
             return camino, fin_tiempo - inicio_tiempo, estados_explorados
 
-        for siguiente_estado in obtener_siguientes_estados(estado_actual):
-            nuevo_costo_g = costo_g[estado_actual] + 1
+        for siguiente_estado, ficha, origen, destino in obtener_siguientes_con_ficha(estado_actual):
+            nuevo_costo_g = costo_g_actual + 1
             if siguiente_estado not in costo_g or nuevo_costo_g < costo_g[siguiente_estado]:
                 costo_g[siguiente_estado] = nuevo_costo_g
-                costo_h = heuristica_manhattan(siguiente_estado)
+                if heuristica is None:
+                    # Solo cambia la contribución de la ficha que se deslizó
+                    costo_h = costo_h_actual - DISTANCIAS_MANHATTAN[ficha][origen] + DISTANCIAS_MANHATTAN[ficha][destino]
+                else:
+                    costo_h = heuristica(empaquetar_estado(siguiente_estado))
                 costo_f = nuevo_costo_g + costo_h
-                heapq.heappush(frontera, (costo_f, siguiente_estado))
+                # Solo se empaqueta el estado si la heurística permite que esté en el perímetro
+                if perimetro is not None and costo_h <= perimetro.radio:
+                    costo_f = nuevo_costo_g + perimetro.estimar(empaquetar_estado(siguiente_estado), costo_h)
+                frontera.agregar(costo_f, nuevo_costo_g, (siguiente_estado, costo_h))
                 camino_previo[siguiente_estado] = estado_actual
+                if observador is not None:
+                    observador.generar(siguiente_estado)
                 
     fin_tiempo = time.time()
     return None, fin_tiempo - inicio_tiempo, estados_explorados
 
+# ------------------------------#
+# A* CON ESTADOS EMPAQUETADOS   #
+# ------------------------------#
+# Cada tablero se codifica como un entero de 64 bits: la ficha de la casilla
+# i (i = fila * 4 + columna) ocupa los bits 4*i .. 4*i + 3. Así los diccionarios
+# y el heap guardan enteros en lugar de tuplas anidadas.
+
+# Casillas vecinas de cada posición del espacio vacío (Arriba, Abajo, Izquierda, Derecha)
+VECINOS_VACIA = tuple(
+    tuple(fila * 4 + col
+          for fila, col in ((i // 4 - 1, i % 4), (i // 4 + 1, i % 4), (i // 4, i % 4 - 1), (i // 4, i % 4 + 1))
+          if 0 <= fila < 4 and 0 <= col < 4)
+    for i in range(16)
+)
+
+def empaquetar_estado(estado):
+    """Convierte un tablero de tuplas en un entero de 64 bits"""
+    codigo = 0
+    for i, ficha in enumerate(num for fila in estado for num in fila):
+        codigo |= ficha << (4 * i)
+    return codigo
+
+def desempaquetar_estado(codigo):
+    """Convierte un entero de 64 bits de nuevo en un tablero de tuplas"""
+    return tuple(tuple((codigo >> (4 * (fila * 4 + col))) & 0xF for col in range(4)) for fila in range(4))
+
+def posicion_vacia_empaquetada(codigo):
+    for i in range(16):
+        if (codigo >> (4 * i)) & 0xF == 0:
+            return i
+    return None
+
+def obtener_siguientes_empaquetados(codigo, vacia):
+    """Genera (codigo, vacia) de cada sucesor deslizando una ficha hacia el espacio vacío"""
+    siguientes = []
+    for destino in VECINOS_VACIA[vacia]:
+        ficha = (codigo >> (4 * destino)) & 0xF
+        # La casilla vacía vale 0, así que basta con restar la ficha de su origen y sumarla en el hueco
+        siguientes.append((codigo - (ficha << (4 * destino)) + (ficha << (4 * vacia)), destino))
+    return siguientes
+
+def heuristica_manhattan_empaquetada(codigo):
+    return sum(DISTANCIAS_MANHATTAN[(codigo >> (4 * i)) & 0xF][i] for i in range(16))
+
+CODIGO_FINAL = empaquetar_estado(ESTADO_FINAL)
+
+# Cada cuántos estados se revisa el límite de tiempo, para no llamar a time.time() en cada nodo
+INTERVALO_REVISION_TIEMPO = 4096
+
+def resolver_con_a_estrella_empaquetado(estado_inicial, heuristica=None, limite_tiempo=None, observador=None,
+                                        perimetro=None):
+    """
+    Igual que resolver_con_a_estrella, pero trabajando con estados empaquetados.
+    Devuelve el camino como tableros de tuplas para que animar_solucion funcione igual.
+    Si se agota limite_tiempo (en segundos) se devuelve el camino como None.
+    """
+    inicio_tiempo = time.time()
+    codigo_inicial = empaquetar_estado(estado_inicial)
+    vacia_inicial = posicion_vacia_empaquetada(codigo_inicial)
+    costo_h_inicial = (heuristica or heuristica_manhattan_empaquetada)(codigo_inicial)
+    costo_f_inicial = costo_h_inicial if perimetro is None else perimetro.estimar(codigo_inicial, costo_h_inicial)
+    frontera = ColaPorCubetas()
+    frontera.agregar(costo_f_inicial, 0, (codigo_inicial, vacia_inicial, costo_h_inicial))
+    camino_previo = {codigo_inicial: None}
+    costo_g = {codigo_inicial: 0}
+    estados_explorados = 0
+
+    while frontera:
+        costo_f_actual, costo_g_actual, (codigo_actual, vacia_actual, costo_h_actual) = frontera.sacar()
+        if costo_g_actual > costo_g[codigo_actual]:
+            if observador is not None:
+                observador.podar(codigo_actual)
+            continue # Entrada obsoleta
+        estados_explorados += 1
+        if observador is not None:
+            observador.expandir(codigo_actual, frontera, costo_g)
+        if (limite_tiempo is not None and estados_explorados % INTERVALO_REVISION_TIEMPO == 0
+                and time.time() - inicio_tiempo > limite_tiempo):
+            break
+
+        if perimetro is not None and costo_f_actual - costo_g_actual <= perimetro.radio:
+            fin_tiempo = time.time()
+            codigos = reconstruir_camino(camino_previo, codigo_actual) + perimetro.cola(codigo_actual)
+            return [desempaquetar_estado(codigo) for codigo in codigos], fin_tiempo - inicio_tiempo, estados_explorados
+
+        if codigo_actual == CODIGO_FINAL:
+            fin_tiempo = time.time()
+            camino = [desempaquetar_estado(codigo) for codigo in reconstruir_camino(camino_previo, codigo_actual)]
+            return camino, fin_tiempo - inicio_tiempo, estados_explorados
+
+        nuevo_costo_g = costo_g_actual + 1
+        for siguiente_codigo, siguiente_vacia in obtener_siguientes_empaquetados(codigo_actual, vacia_actual):
+            if siguiente_codigo not in costo_g or nuevo_costo_g < costo_g[siguiente_codigo]:
+                costo_g[siguiente_codigo] = nuevo_costo_g
+                if heuristica is None:
+                    # La ficha que estaba en siguiente_vacia pasa a ocupar vacia_actual
+                    ficha = (codigo_actual >> (4 * siguiente_vacia)) & 0xF
+                    costo_h = costo_h_actual - DISTANCIAS_MANHATTAN[ficha][siguiente_vacia] + DISTANCIAS_MANHATTAN[ficha][vacia_actual]
+                else:
+                    costo_h = heuristica(siguiente_codigo)
+                costo_f = nuevo_costo_g + costo_h
+                if perimetro is not None:
+                    costo_f = nuevo_costo_g + perimetro.estimar(siguiente_codigo, costo_h)
+                frontera.agregar(costo_f, nuevo_costo_g, (siguiente_codigo, siguiente_vacia, costo_h))
+                camino_previo[siguiente_codigo] = codigo_actual
+                if observador is not None:
+                    observador.generar(siguiente_codigo)
+
+    fin_tiempo = time.time()
+    return None, fin_tiempo - inicio_tiempo, estados_explorados
+
+# ---------------#
+# ALGORITMO IDA* #
+# ---------------#
+
+class _TiempoAgotado(Exception):
+    pass
+
+def resolver_con_ida_estrella(estado_inicial, heuristica=None, limite_tiempo=None, observador=None):
+    """
+    A* por profundización iterativa sobre f = g + h.
+    Solo guarda el camino actual, así que la memoria crece con la profundidad de la
+    solución y no con los estados generados. Se asume que el estado es resolvible
+    (ver es_resolvible); de lo contrario la búsqueda no termina salvo que se indique
+    limite_tiempo (en segundos), en cuyo caso se devuelve el camino como None.
+    """
+    inicio_tiempo = time.time()
+    codigo_inicial = empaquetar_estado(estado_inicial)
+    camino = [codigo_inicial]
+    estados_explorados = 0
+
+    def buscar(codigo, vacia, vacia_previa, costo_g, costo_h, limite):
+        """Devuelve None si encontró la meta o el menor f que superó el límite"""
+        nonlocal estados_explorados
+        costo_f = costo_g + costo_h
+        if costo_f > limite:
+            if observador is not None:
+                observador.podar(codigo)
+            return costo_f
+        estados_explorados += 1
+        if observador is not None:
+            # La "frontera" de IDA* es el camino actual
+            observador.expandir(codigo, camino)
+        if (limite_tiempo is not None and estados_explorados % INTERVALO_REVISION_TIEMPO == 0
+                and time.time() - inicio_tiempo > limite_tiempo):
+            raise _TiempoAgotado()
+        if codigo == CODIGO_FINAL:
+            return None
+
+        siguiente_limite = math.inf
+        for destino in VECINOS_VACIA[vacia]:
+            # No deshacer el movimiento anterior
+            if destino == vacia_previa:
+                continue
+            ficha = (codigo >> (4 * destino)) & 0xF
+            siguiente_codigo = codigo - (ficha << (4 * destino)) + (ficha << (4 * vacia))
+            if heuristica is None:
+                siguiente_h = costo_h - DISTANCIAS_MANHATTAN[ficha][destino] + DISTANCIAS_MANHATTAN[ficha][vacia]
+            else:
+                siguiente_h = heuristica(siguiente_codigo)
+            if observador is not None:
+                observador.generar(siguiente_codigo)
+            camino.append(siguiente_codigo)
+            resultado = buscar(siguiente_codigo, destino, vacia, costo_g + 1, siguiente_h, limite)
+            if resultado is None:
+                return None
+            camino.pop()
+            siguiente_limite = min(siguiente_limite, resultado)
+        return siguiente_limite
+
+    vacia_inicial = posicion_vacia_empaquetada(codigo_inicial)
+    costo_h_inicial = (heuristica or heuristica_manhattan_empaquetada)(codigo_inicial)
+    limite = costo_h_inicial
+    while limite != math.inf:
+        try:
+            limite = buscar(codigo_inicial, vacia_inicial, None, 0, costo_h_inicial, limite)
+        except _TiempoAgotado:
+            break
+        if limite is None:
+            fin_tiempo = time.time()
+            return [desempaquetar_estado(codigo) for codigo in camino], fin_tiempo - inicio_tiempo, estados_explorados
+
+    fin_tiempo = time.time()
+    return None, fin_tiempo - inicio_tiempo, estados_explorados
+
+# ------------------#
+# A* BIDIRECCIONAL  #
+# ------------------#
+
+def crear_heuristica_hacia(estado):
+    """Distancia Manhattan de un estado empaquetado hacia `estado` (para la búsqueda hacia atrás)"""
+    posiciones = {ficha: fila * 4 + col for fila, fila_vals in enumerate(estado) for col, ficha in enumerate(fila_vals)}
+    distancias = tuple(
+        tuple(0 if ficha == 0 else abs(i // 4 - posiciones[ficha] // 4) + abs(i % 4 - posiciones[ficha] % 4)
+              for i in range(16))
+        for ficha in range(16)
+    )
+
+    def heuristica_hacia(codigo):
+        return sum(distancias[(codigo >> (4 * i)) & 0xF][i] for i in range(16))
+
+    return heuristica_hacia
+
+def resolver_con_a_estrella_bidireccional(estado_inicial, heuristica=None, limite_tiempo=None, observador=None):
+    """
+    A* que crece dos fronteras a la vez: una desde el estado inicial hacia
+    ESTADO_FINAL y otra desde ESTADO_FINAL hacia el inicial. En cada paso se expande
+    la frontera con la f mínima más baja. `mejor_costo` guarda el camino más corto
+    encontrado que une ambas búsquedas, y se puede parar en cuanto
+    mejor_costo <= max(f mínima adelante, f mínima atrás); con heurísticas
+    consistentes ningún camino pendiente puede ser más corto.
+
+    `heuristica` (por defecto Manhattan) guía la búsqueda hacia adelante; la de
+    atrás usa la distancia Manhattan al estado inicial. Devuelve lo mismo que
+    resolver_con_a_estrella_empaquetado.
+
+    Con Manhattan en ambos sentidos expande más estados que A* hacia adelante (para
+    probar que el camino es óptimo, las dos fronteras tienen que llegar a la f del
+    óptimo), así que no está en ALGORITMOS_LOTE; queda para comparar en benchmark.py.
+    """
+    inicio_tiempo = time.time()
+    codigo_inicial = empaquetar_estado(estado_inicial)
+    heuristicas = (heuristica or heuristica_manhattan_empaquetada, crear_heuristica_hacia(estado_inicial))
+    # Índice 0: hacia adelante (desde el inicio); índice 1: hacia atrás (desde la meta)
+    fronteras = (ColaPorCubetas(), ColaPorCubetas())
+    costos_g = ({codigo_inicial: 0}, {CODIGO_FINAL: 0})
+    caminos_previos = ({codigo_inicial: None}, {CODIGO_FINAL: None})
+    for lado, codigo in ((0, codigo_inicial), (1, CODIGO_FINAL)):
+        fronteras[lado].agregar(heuristicas[lado](codigo), 0, (codigo, posicion_vacia_empaquetada(codigo)))
+
+    mejor_costo = 0 if codigo_inicial == CODIGO_FINAL else math.inf
+    encuentro = codigo_inicial if mejor_costo == 0 else None
+    estados_explorados = 0
+
+    def f_minima(lado):
+        """f del mejor nodo vigente de la frontera, descartando entradas obsoletas"""
+        frontera, costo_g = fronteras[lado], costos_g[lado]
+        while frontera:
+            costo_f, g, (codigo, _) = frontera.ver()
+            if g <= costo_g[codigo]:
+                return costo_f
+            frontera.sacar()
+        return math.inf
+
+    while fronteras[0] and fronteras[1]:
+        f_adelante, f_atras = f_minima(0), f_minima(1)
+        if mejor_costo <= max(f_adelante, f_atras):
+            break
+        lado = 0 if f_adelante <= f_atras else 1
+        _, costo_g_actual, (codigo_actual, vacia_actual) = fronteras[lado].sacar()
+        costo_g, otro_costo_g = costos_g[lado], costos_g[1 - lado]
+        estados_explorados += 1
+        if observador is not None:
+            observador.expandir(codigo_actual, fronteras[lado], costo_g)
+        if (limite_tiempo is not None and estados_explorados % INTERVALO_REVISION_TIEMPO == 0
+                and time.time() - inicio_tiempo > limite_tiempo):
+            fin_tiempo = time.time()
+            return None, fin_tiempo - inicio_tiempo, estados_explorados
+
+        nuevo_costo_g = costo_g_actual + 1
+        for siguiente_codigo, siguiente_vacia in obtener_siguientes_empaquetados(codigo_actual, vacia_actual):
+            if siguiente_codigo in costo_g and nuevo_costo_g >= costo_g[siguiente_codigo]:
+                continue
+            costo_g[siguiente_codigo] = nuevo_costo_g
+            caminos_previos[lado][siguiente_codigo] = codigo_actual
+            costo_f = nuevo_costo_g + heuristicas[lado](siguiente_codigo)
+            fronteras[lado].agregar(costo_f, nuevo_costo_g, (siguiente_codigo, siguiente_vacia))
+            if observador is not None:
+                observador.generar(siguiente_codigo)
+            if siguiente_codigo in otro_costo_g and nuevo_costo_g + otro_costo_g[siguiente_codigo] < mejor_costo:
+                mejor_costo = nuevo_costo_g + otro_costo_g[siguiente_codigo]
+                encuentro = siguiente_codigo
+
+    fin_tiempo = time.time()
+    if encuentro is None:
+        return None, fin_tiempo - inicio_tiempo, estados_explorados
+    # Del inicio al punto de encuentro, y de ahí siguiendo los padres de la búsqueda hacia atrás
+    camino = reconstruir_camino(caminos_previos[0], encuentro)
+    codigo = caminos_previos[1][encuentro]
+    while codigo is not None:
+        camino.append(codigo)
+        codigo = caminos_previos[1][codigo]
+    return [desempaquetar_estado(codigo) for codigo in camino], fin_tiempo - inicio_tiempo, estados_explorados
+
+# ------------------------------------#
+# BASE DE DATOS DE PATRONES (ADITIVA) #
+# ------------------------------------#
+# Cada grupo de fichas tiene una tabla con el mínimo de movimientos de esas fichas
+# para llevarlas a su lugar en ESTADO_FINAL, sin contar los movimientos de las demás.
+# Como los grupos son disjuntos, la suma de las tablas sigue siendo admisible.
+# Una tabla de k fichas se indexa con la posición de cada ficha en base 16
+# (casilla_0 + 16 * casilla_1 + ...) y ocupa 16**k bytes.
+
+PARTICION_6_6_3 = ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4))
+PARTICION_5_5_5 = ((1, 5, 6, 9, 13), (2, 3, 4, 7, 8), (10, 11, 12, 14, 15))
+
+DIRECTORIO_PATRONES = os.path.dirname(os.path.abspath(__file__))
+SIN_VALOR = 255
+
+# Máscaras de bits (una por casilla) de las casillas adyacentes a cada casilla
+ADYACENTES = tuple(sum(1 << vecina for vecina in VECINOS_VACIA[i]) for i in range(16))
+_SIN_COLUMNA_0 = 0xEEEE
+_SIN_COLUMNA_3 = 0x7777
+
+def _region_vacia(casilla_vacia, ocupadas):
+    """Máscara de las casillas a las que llega el hueco sin mover fichas del patrón"""
+    libres = 0xFFFF & ~ocupadas
+    region = 1 << casilla_vacia
+    while True:
+        expandida = region | ((region << 1) & _SIN_COLUMNA_0) | ((region >> 1) & _SIN_COLUMNA_3) | ((region << 4) & 0xFFFF) | (region >> 4)
+        expandida &= libres
+        if expandida == region:
+            return region
+        region = expandida
+
+def construir_tabla_patron(fichas):
+    """
+    BFS retrógrado desde ESTADO_FINAL sobre las posiciones de las fichas del patrón.
+    El hueco se representa por la región de casillas libres que puede recorrer gratis,
+    así cada nivel del BFS cuenta solo movimientos de fichas del patrón.
+    """
+    k = len(fichas)
+    tabla = bytearray([SIN_VALOR]) * (16 ** k)
+    visitados = bytearray(16 ** (k + 1) // 8)
+    pesos = [16 ** j for j in range(k)]
+
+    posiciones_finales = [POSICIONES_FINALES[ficha][0] * 4 + POSICIONES_FINALES[ficha][1] for ficha in fichas]
+    vacia_final = POSICIONES_FINALES[0][0] * 4 + POSICIONES_FINALES[0][1]
+    indice_inicial = sum(casilla * peso for casilla, peso in zip(posiciones_finales, pesos))
+    ocupadas = sum(1 << casilla for casilla in posiciones_finales)
+    region = _region_vacia(vacia_final, ocupadas)
+
+    clave = indice_inicial * 16 + (region & -region).bit_length() - 1
+    visitados[clave >> 3] |= 1 << (clave & 7)
+    tabla[indice_inicial] = 0
+    nivel = [(indice_inicial, region)]
+    costo = 0
+
+    while nivel:
+        costo += 1
+        siguiente_nivel = []
+        for indice, region in nivel:
+            posiciones = [(indice >> (4 * j)) & 0xF for j in range(k)]
+            ocupadas = sum(1 << casilla for casilla in posiciones)
+            for j, casilla in enumerate(posiciones):
+                destinos = ADYACENTES[casilla] & region
+                while destinos:
+                    bit = destinos & -destinos
+                    destinos ^= bit
+                    destino = bit.bit_length() - 1
+                    nuevo_indice = indice + (destino - casilla) * pesos[j]
+                    # Tras el movimiento el hueco queda donde estaba la ficha
+                    nueva_region = _region_vacia(casilla, ocupadas ^ (1 << casilla) ^ bit)
+                    clave = nuevo_indice * 16 + (nueva_region & -nueva_region).bit_length() - 1
+                    if visitados[clave >> 3] & (1 << (clave & 7)):
+                        continue
+                    visitados[clave >> 3] |= 1 << (clave & 7)
+                    if tabla[nuevo_indice] == SIN_VALOR:
+                        tabla[nuevo_indice] = costo
+                    siguiente_nivel.append((nuevo_indice, nueva_region))
+        nivel = siguiente_nivel
+    return tabla
+
+def ruta_tabla_patron(fichas, directorio=None):
+    nombre = "patron_" + "-".join(str(ficha) for ficha in fichas) + ".bin"
+    return os.path.join(directorio or DIRECTORIO_PATRONES, nombre)
+
+def cargar_tabla_patron(fichas, directorio=None):
+    """Mapea en memoria la tabla guardada en disco; solo la construye si no existe"""
+    ruta = ruta_tabla_patron(fichas, directorio)
+    if not os.path.exists(ruta):
+        # Las tablas de 6 fichas tardan varios minutos; se avisa para que no parezca colgado
+        print(f"Construyendo la tabla de patrones {os.path.basename(ruta)} (solo la primera vez)...",
+              file=sys.stderr, flush=True)
+        tabla = construir_tabla_patron(fichas)
+        # Se escribe en un archivo temporal para no dejar tablas a medias si se interrumpe;
+        # el temporal es por proceso porque varios trabajadores de resolver_lote pueden construirla a la vez
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(tabla)
+        os.replace(temporal, ruta)
+    with open(ruta, "rb") as archivo:
+        return mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+def crear_heuristica_patrones(particion=PARTICION_6_6_3, directorio=None):
+    """
+    Devuelve una heurística sobre estados empaquetados que suma las tablas de cada grupo
+    de la partición. Se usa en lugar de la Manhattan pasándola como `heuristica` a
+    resolver_con_a_estrella, resolver_con_a_estrella_empaquetado o resolver_con_ida_estrella.
+    """
+    tablas = [cargar_tabla_patron(fichas, directorio) for fichas in particion]
+    grupo_de_ficha = [None] * 16
+    peso_de_ficha = [0] * 16
+    for grupo, fichas in enumerate(particion):
+        for j, ficha in enumerate(fichas):
+            grupo_de_ficha[ficha] = grupo
+            peso_de_ficha[ficha] = 16 ** j
+
+    def heuristica_patrones(codigo):
+        indices = [0] * len(tablas)
+        for casilla in range(16):
+            ficha = (codigo >> (4 * casilla)) & 0xF
+            grupo = grupo_de_ficha[ficha]
+            if grupo is not None:
+                indices[grupo] += casilla * peso_de_ficha[ficha]
+        return sum(tabla[indice] for tabla, indice in zip(tablas, indices))
+
+    return heuristica_patrones
+
+# ----------------------#
+# PERÍMETRO DE LA META  #
+# ----------------------#
+# Todos los estados a lo más `radio` movimientos de ESTADO_FINAL, con su distancia
+# exacta y la casilla a la que se mueve el espacio vacío para acercarse a la meta.
+# Se guarda ordenado por código empaquetado: n códigos de 8 bytes, luego n bytes de
+# distancias y luego n bytes de movimientos, y se busca con bisect sobre el mmap.
+
+RADIO_PERIMETRO = 16
+SIN_MOVIMIENTO = 255
+
+class PerimetroMeta:
+    """Vista de solo lectura sobre el perímetro guardado en disco"""
+    def __init__(self, datos, radio):
+        n = len(datos) // 10
+        vista = memoryview(datos)
+        self.datos = datos
+        self.radio = radio
+        self.codigos = vista[:8 * n].cast('Q')
+        self.distancias = vista[8 * n:9 * n]
+        self.movimientos = vista[9 * n:10 * n]
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def _indice(self, codigo):
+        i = bisect.bisect_left(self.codigos, codigo)
+        if i < len(self.codigos) and self.codigos[i] == codigo:
+            return i
+        return None
+
+    def distancia(self, codigo):
+        """Distancia exacta a la meta, o None si el estado está fuera del perímetro"""
+        i = self._indice(codigo)
+        return None if i is None else self.distancias[i]
+
+    def estimar(self, codigo, costo_h):
+        """
+        Mejora la cota admisible `costo_h`: dentro del perímetro es la distancia exacta
+        y fuera vale al menos radio + 1. Los estados con costo_h > radio no pueden
+        estar dentro, así que ni siquiera se buscan.
+        """
+        if costo_h > self.radio:
+            return costo_h
+        distancia = self.distancia(codigo)
+        if distancia is None:
+            return max(costo_h, self.radio + 1)
+        return distancia
+
+    def cola(self, codigo):
+        """Códigos de los estados que siguen a `codigo` (sin incluirlo) hasta CODIGO_FINAL"""
+        cola = []
+        vacia = posicion_vacia_empaquetada(codigo)
+        while codigo != CODIGO_FINAL:
+            destino = self.movimientos[self._indice(codigo)]
+            ficha = (codigo >> (4 * destino)) & 0xF
+            codigo = codigo - (ficha << (4 * destino)) + (ficha << (4 * vacia))
+            vacia = destino
+            cola.append(codigo)
+        return cola
+
+def construir_perimetro(radio):
+    """BFS desde ESTADO_FINAL hasta `radio`; regresa el contenido del archivo"""
+    vacia_final = posicion_vacia_empaquetada(CODIGO_FINAL)
+    # codigo -> (distancia, casilla a la que se mueve el vacío para volver al padre)
+    perimetro = {CODIGO_FINAL: (0, SIN_MOVIMIENTO)}
+    nivel = [(CODIGO_FINAL, vacia_final)]
+    for distancia in range(1, radio + 1):
+        siguiente_nivel = []
+        for codigo, vacia in nivel:
+            for siguiente_codigo, siguiente_vacia in obtener_siguientes_empaquetados(codigo, vacia):
+                if siguiente_codigo not in perimetro:
+                    perimetro[siguiente_codigo] = (distancia, vacia)
+                    siguiente_nivel.append((siguiente_codigo, siguiente_vacia))
+        nivel = siguiente_nivel
+
+    codigos = sorted(perimetro)
+    datos = bytearray(array.array('Q', codigos).tobytes())
+    datos += bytes(perimetro[codigo][0] for codigo in codigos)
+    datos += bytes(perimetro[codigo][1] for codigo in codigos)
+    return datos
+
+def ruta_perimetro(radio, directorio=None):
+    return os.path.join(directorio or DIRECTORIO_PATRONES, f"perimetro_{radio}.bin")
+
+def cargar_perimetro(radio=RADIO_PERIMETRO, directorio=None):
+    """Mapea en memoria el perímetro guardado en disco; solo lo construye si no existe"""
+    ruta = ruta_perimetro(radio, directorio)
+    if not os.path.exists(ruta):
+        datos = construir_perimetro(radio)
+        # Temporal por proceso: varios trabajadores de resolver_lote pueden construirlo a la vez
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(datos)
+        os.replace(temporal, ruta)
+    with open(ruta, "rb") as archivo:
+        return PerimetroMeta(mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ), radio)
+
+# Perímetros ya mapeados en este proceso, por radio
+_perimetros = {}
+
+def resolver_con_perimetro(estado_inicial, limite_tiempo=None, radio=RADIO_PERIMETRO, observador=None):
+    """A* empaquetado que carga el perímetro una sola vez por proceso (para resolver_lote)"""
+    if radio not in _perimetros:
+        _perimetros[radio] = cargar_perimetro(radio)
+    return resolver_con_a_estrella_empaquetado(estado_inicial, limite_tiempo=limite_tiempo,
+                                               observador=observador, perimetro=_perimetros[radio])
+
+# ---------------------#
+# RESOLUCIÓN EN LOTES  #
+# ---------------------#
+
+ALGORITMOS_LOTE = {
+    'ida_estrella': resolver_con_ida_estrella,
+    'a_estrella': resolver_con_a_estrella_empaquetado,
+    'a_estrella_perimetro': resolver_con_perimetro,
+}
+
+def leer_tableros(ruta):
+    """
+    Lee un tablero por línea: 16 números separados por espacios o comas, fila por fila.
+    Se ignoran las líneas vacías y las que empiezan con '#'.
+    """
+    with open(ruta) as archivo:
+        for linea in archivo:
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+            numeros = [int(num) for num in linea.replace(',', ' ').split()]
+            if len(numeros) != 16 or sorted(numeros) != list(range(16)):
+                raise ValueError(f"Tablero inválido: {linea}")
+            yield tuple(tuple(numeros[fila * 4:fila * 4 + 4]) for fila in range(4))
+
+def _resolver_tablero(indice, estado, algoritmo, limite_tiempo):
+    """Se ejecuta en un proceso del pool; devuelve un diccionario con el resultado"""
+    camino, tiempo, estados_explorados = ALGORITMOS_LOTE[algoritmo](estado, limite_tiempo=limite_tiempo)
+    return {
+        'indice': indice,
+        'estado': estado,
+        'resultado': 'resuelto' if camino else 'tiempo_agotado',
+        'movimientos': len(camino) - 1 if camino else None,
+        'estados_explorados': estados_explorados,
+        'tiempo': tiempo,
+    }
+
+def resolver_lote(tableros, algoritmo='ida_estrella', limite_tiempo=60, max_procesos=None):
+    """
+    Resuelve muchos tableros en paralelo con un ProcessPoolExecutor.
+    `tableros` puede ser un iterable de tableros o la ruta de un archivo (ver leer_tableros).
+    Es un generador: entrega cada resultado en cuanto termina, no en el orden de entrada.
+    Los tableros sin solución se reportan sin mandarlos al pool.
+    """
+    if isinstance(tableros, str):
+        tableros = leer_tableros(tableros)
+
+    max_procesos = max_procesos or os.cpu_count() or 1
+    # Se limita el número de tareas pendientes para poder leer archivos enormes sin cargarlos completos
+    max_pendientes = 4 * max_procesos
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_procesos) as ejecutor:
+        pendientes = set()
+        for indice, estado in enumerate(tableros):
+            if not es_resolvible(estado):
+                yield {'indice': indice, 'estado': estado, 'resultado': 'sin_solucion',
+                       'movimientos': None, 'estados_explorados': 0, 'tiempo': 0.0}
+                continue
+            pendientes.add(ejecutor.submit(_resolver_tablero, indice, estado, algoritmo, limite_tiempo))
+            if len(pendientes) >= max_pendientes:
+                terminados, pendientes = concurrent.futures.wait(pendientes, return_when=concurrent.futures.FIRST_COMPLETED)
+                for futuro in terminados:
+                    yield futuro.result()
+        for futuro in concurrent.futures.as_completed(pendientes):
+            yield futuro.result()
+
 # -----#
 # MAIN #
 # -----#
 
 if __name__ == "__main__":
+    # Con un archivo como argumento se resuelven todos sus tableros en paralelo
+    if len(sys.argv) > 1:
+        for resultado in resolver_lote(sys.argv[1]):
+            print(resultado['indice'], resultado['resultado'], resultado['movimientos'],
+                  resultado['estados_explorados'], f"{resultado['tiempo']:.5f}")
+        sys.exit(0)
+
     # Estado inicial
     estado_inicial = ((1, 2, 3, 4),
                       (5, 6, 7, 8),
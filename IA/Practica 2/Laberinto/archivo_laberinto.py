@@ -0,0 +1,215 @@
+"""
+Lectura y escritura de laberintos en archivo.
+
+Formatos:
+    texto: una fila por línea con '#', ' ', 'I' y 'F', todas del mismo ancho.
+    bits:  encabezado con las dimensiones y las posiciones de 'I' y 'F', seguido
+           de un bit por celda (1 = muro); cada fila ocupa un número entero de bytes.
+
+Los cargadores no arman listas de listas: regresan una vista de solo lectura
+sobre un búfer compacto (un byte por celda en texto, un bit en el formato de
+bits) o directamente sobre el archivo mapeado en memoria. La vista se indexa
+como la lista original (vista[fila][columna], len(vista), len(vista[0])), así
+que los solvers de dfs.py la aceptan sin cambios.
+"""
+import mmap
+import struct
+
+MAGIA_BITS = b'LABB'
+# magia, alto, ancho, fila y columna de 'I', fila y columna de 'F' (-1 si no hay)
+ENCABEZADO_BITS = struct.Struct('<4sIIiiii')
+MURO_BYTE = ord('#')
+
+
+class FilaVista:
+    """Una fila de una vista; se crea al vuelo en cada vista[fila]"""
+    __slots__ = ('vista', 'fila')
+
+    def __init__(self, vista, fila):
+        self.vista = vista
+        self.fila = fila
+
+    def __len__(self):
+        return self.vista.ancho
+
+    def __getitem__(self, columna):
+        return self.vista.celda(self.fila, columna)
+
+    def __iter__(self):
+        for columna in range(self.vista.ancho):
+            yield self.vista.celda(self.fila, columna)
+
+    def __contains__(self, caracter):
+        return self.vista.buscar_en_fila(self.fila, caracter) is not None
+
+    def index(self, caracter):
+        columna = self.vista.buscar_en_fila(self.fila, caracter)
+        if columna is None:
+            raise ValueError(f"{caracter!r} no está en la fila {self.fila}")
+        return columna
+
+
+class VistaLaberinto:
+    """Base común: indexado por filas e iteración, como una lista de listas"""
+    def __len__(self):
+        return self.alto
+
+    def __getitem__(self, fila):
+        if not 0 <= fila < self.alto:
+            raise IndexError(fila)
+        return FilaVista(self, fila)
+
+    def __iter__(self):
+        for fila in range(self.alto):
+            yield FilaVista(self, fila)
+
+
+class VistaTexto(VistaLaberinto):
+    """
+    Vista sobre texto: `datos` es un bytes/bytearray/mmap donde la celda
+    (fila, columna) está en desplazamiento + fila * paso + columna. En un archivo
+    mapeado el paso es ancho + 1 por el salto de línea.
+    """
+    def __init__(self, datos, alto, ancho, paso, desplazamiento=0):
+        self.datos = datos
+        self.alto = alto
+        self.ancho = ancho
+        self.paso = paso
+        self.desplazamiento = desplazamiento
+
+    def celda(self, fila, columna):
+        return chr(self.datos[self.desplazamiento + fila * self.paso + columna])
+
+    def buscar_en_fila(self, fila, caracter):
+        base = self.desplazamiento + fila * self.paso
+        posicion = self.datos.find(caracter.encode('ascii'), base, base + self.ancho)
+        return None if posicion == -1 else posicion - base
+
+
+class VistaBits(VistaLaberinto):
+    """Vista sobre el formato de bits; 'I' y 'F' vienen del encabezado"""
+    def __init__(self, datos, alto, ancho, inicio, fin, desplazamiento=0):
+        self.datos = datos
+        self.alto = alto
+        self.ancho = ancho
+        self.bytes_por_fila = (ancho + 7) // 8
+        self.inicio = inicio
+        self.fin = fin
+        self.desplazamiento = desplazamiento
+
+    def celda(self, fila, columna):
+        byte = self.datos[self.desplazamiento + fila * self.bytes_por_fila + (columna >> 3)]
+        if byte >> (columna & 7) & 1:
+            return '#'
+        if (fila, columna) == self.inicio:
+            return 'I'
+        if (fila, columna) == self.fin:
+            return 'F'
+        return ' '
+
+    def buscar_en_fila(self, fila, caracter):
+        for punto, marca in ((self.inicio, 'I'), (self.fin, 'F')):
+            if caracter == marca and punto is not None and punto[0] == fila:
+                return punto[1]
+        if caracter in ('I', 'F'):
+            return None
+        for columna in range(self.ancho):
+            if self.celda(fila, columna) == caracter:
+                return columna
+        return None
+
+
+# --------------------------------------------------------------------------
+# CARGA
+# --------------------------------------------------------------------------
+
+def _mapear(ruta):
+    with open(ruta, 'rb') as archivo:
+        return mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+def cargar_texto(ruta, usar_mmap=False):
+    """
+    Lee un laberinto de texto. Sin mmap se lee línea por línea a un bytearray de
+    alto * ancho bytes; con mmap no se copia nada y el archivo debe tener todas
+    las líneas del mismo ancho terminadas en '\\n'.
+    """
+    if usar_mmap:
+        datos = _mapear(ruta)
+        ancho = datos.find(b'\n')
+        if ancho == -1:
+            ancho = len(datos)
+        paso = ancho + 1
+        alto = (len(datos) + 1) // paso
+        return VistaTexto(datos, alto, ancho, paso)
+
+    datos = bytearray()
+    ancho = None
+    with open(ruta, 'rb') as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            linea = linea.rstrip(b'\r\n')
+            if ancho is None:
+                ancho = len(linea)
+            elif len(linea) != ancho:
+                raise ValueError(f"{ruta}:{numero}: la fila mide {len(linea)} y se esperaban {ancho}")
+            datos += linea
+    ancho = ancho or 0
+    alto = len(datos) // ancho if ancho else 0
+    return VistaTexto(datos, alto, ancho, ancho)
+
+def cargar_bits(ruta, usar_mmap=False):
+    """Lee un laberinto en formato de bits (ver guardar_bits)"""
+    if usar_mmap:
+        datos = _mapear(ruta)
+        encabezado = datos[:ENCABEZADO_BITS.size]
+    else:
+        with open(ruta, 'rb') as archivo:
+            encabezado = archivo.read(ENCABEZADO_BITS.size)
+            datos = archivo.read()
+    magia, alto, ancho, fila_i, columna_i, fila_f, columna_f = ENCABEZADO_BITS.unpack(encabezado)
+    if magia != MAGIA_BITS:
+        raise ValueError(f"{ruta} no es un laberinto en formato de bits")
+    inicio = (fila_i, columna_i) if fila_i >= 0 else None
+    fin = (fila_f, columna_f) if fila_f >= 0 else None
+    desplazamiento = ENCABEZADO_BITS.size if usar_mmap else 0
+    return VistaBits(datos, alto, ancho, inicio, fin, desplazamiento)
+
+def cargar_laberinto(ruta, usar_mmap=False):
+    """Detecta el formato por la firma del archivo y regresa la vista correspondiente"""
+    with open(ruta, 'rb') as archivo:
+        firma = archivo.read(len(MAGIA_BITS))
+    if firma == MAGIA_BITS:
+        return cargar_bits(ruta, usar_mmap)
+    return cargar_texto(ruta, usar_mmap)
+
+# --------------------------------------------------------------------------
+# ESCRITURA
+# --------------------------------------------------------------------------
+
+def guardar_texto(laberinto, ruta):
+    """Escribe fila por fila; `laberinto` puede ser una lista de listas o una vista"""
+    with open(ruta, 'w', newline='\n') as archivo:
+        for fila in laberinto:
+            archivo.write(''.join(fila))
+            archivo.write('\n')
+
+def guardar_bits(laberinto, ruta):
+    """
+    Escribe fila por fila en formato de bits. Las posiciones de 'I' y 'F' se
+    conocen al terminar, así que el encabezado se reescribe al final.
+    """
+    alto, ancho = len(laberinto), len(laberinto[0]) if len(laberinto) else 0
+    inicio, fin = (-1, -1), (-1, -1)
+    with open(ruta, 'wb') as archivo:
+        archivo.write(ENCABEZADO_BITS.pack(MAGIA_BITS, alto, ancho, *inicio, *fin))
+        for numero_fila, fila in enumerate(laberinto):
+            empaquetada = bytearray((ancho + 7) // 8)
+            for columna, celda in enumerate(fila):
+                if celda == '#':
+                    empaquetada[columna >> 3] |= 1 << (columna & 7)
+                elif celda == 'I':
+                    inicio = (numero_fila, columna)
+                elif celda == 'F':
+                    fin = (numero_fila, columna)
+            archivo.write(empaquetada)
+        archivo.seek(0)
+        archivo.write(ENCABEZADO_BITS.pack(MAGIA_BITS, alto, ancho, *inicio, *fin))
@@ -1,7 +1,6 @@
 from colorama import Fore, Style, init
+import sys
 import collections
-import copy
-import heapq  #? heapq para la cola de prioridad de A*
 
 # Inicializar colorama para los colores
 init(autoreset=True)
@@ -10,21 +9,56 @@ init(autoreset=True)
 # SECCIÓN COMÚN Y DE IMPRESIÓN
 # --------------------------------------------------------------------------
 
-def imprimir_laberinto(laberinto):
+# Letra de cada paso del camino: Derecha, Abajo, Izquierda, Arriba
+LETRAS_MOVIMIENTO = {(0, 1): 'D', (1, 0): 'B', (0, -1): 'I', (-1, 0): 'A'}
+
+def camino_como_movimientos(camino):
+    """Camino de celdas como cadena compacta de movimientos, p. ej. 'DDBBI'"""
+    return "".join(LETRAS_MOVIMIENTO[(f2 - f1, c2 - c1)] for (f1, c1), (f2, c2) in zip(camino, camino[1:]))
+
+def imprimir_laberinto(laberinto, camino=None, salida=None):
     """
     Imprime el laberinto con colores para una mejor visualización.
+    Si se pasa `camino`, sus celdas se dibujan con '*' encima del laberinto sin
+    modificarlo, así funciona también con vistas de solo lectura.
+
+    Todo el dibujo se arma en un solo búfer y se escribe de una vez; los códigos
+    de color solo se emiten cuando cambia el color. Si la salida no es una
+    terminal, el laberinto sale sin colores y, si hay camino, en lugar del
+    dibujo se escriben sus movimientos como texto compacto.
     """
-    for fila in laberinto:
-        linea_a_imprimir = []
-        for celda in fila:
-            if celda == '*':
-                linea_a_imprimir.append(Fore.GREEN + Style.BRIGHT + celda)
-            elif celda in ('#', 'I', 'F'):
-                linea_a_imprimir.append(Fore.WHITE + Style.BRIGHT + celda)
-            else:
-                linea_a_imprimir.append(celda)
-        print(" ".join(linea_a_imprimir))
-    print("\n")
+    salida = salida or sys.stdout
+    es_terminal = salida.isatty()
+    if camino and not es_terminal:
+        salida.write(f"Camino ({len(camino) - 1} pasos): {camino_como_movimientos(camino)}\n\n\n")
+        return
+
+    celdas_camino = set(camino) if camino else set()
+    bufer = []
+    for numero_fila, fila in enumerate(laberinto):
+        color_actual = None
+        for numero_columna, celda in enumerate(fila):
+            if celda not in ('I', 'F') and (numero_fila, numero_columna) in celdas_camino:
+                celda = '*'
+            if es_terminal:
+                if celda == '*':
+                    color = Fore.GREEN + Style.BRIGHT
+                elif celda in ('#', 'I', 'F'):
+                    color = Fore.WHITE + Style.BRIGHT
+                else:
+                    color = color_actual # Los espacios se ven igual en cualquier color
+                if color != color_actual:
+                    bufer.append(color)
+                    color_actual = color
+            if numero_columna:
+                bufer.append(" ")
+            bufer.append(celda)
+        if color_actual is not None:
+            bufer.append(Style.RESET_ALL)
+        bufer.append("\n")
+    bufer.append("\n\n")
+    salida.write("".join(bufer))
+    salida.flush()
 
 def encontrar_puntos(laberinto):
     """
@@ -48,79 +82,207 @@ def resolver_con_dfs(laberinto):
         print("Error: No se encontró 'I'.")
         return
 
-    visitados = set()
-    if buscar_solucion_dfs_recursivo(laberinto, inicio[0], inicio[1], visitados):
-        laberinto[inicio[0]][inicio[1]] = 'I'
-        imprimir_laberinto(laberinto)
+    path_solucion, _ = buscar_camino_dfs(laberinto, inicio)
+    if path_solucion:
+        imprimir_laberinto(laberinto, path_solucion)
     else:
         print("No se pudo encontrar una solución con DFS.\n")
 
-def buscar_solucion_dfs_recursivo(laberinto, fila, columna, visitados):
-    if not (0 <= fila < len(laberinto) and 0 <= columna < len(laberinto[0])): ##! La ubicacion esta fuera del mapa
-        return False
-    if laberinto[fila][columna] == '#' or (fila, columna) in visitados: ##! La ubicacion es un muro o ya se visitó
-        return False
-    if laberinto[fila][columna] == 'F': ##* La ubicacion es el final del laberinto
-        return True
-
-    ## Celda vacia, se agrega a lista de visitados y se marca en el laberinto
-    visitados.add((fila, columna))
-    if laberinto[fila][columna] != 'I':
-        laberinto[fila][columna] = '*'
-
-    ##D, Ab, I, Ar
-    if (buscar_solucion_dfs_recursivo(laberinto, fila, columna + 1, visitados) or
-        buscar_solucion_dfs_recursivo(laberinto, fila + 1, columna, visitados) or
-        buscar_solucion_dfs_recursivo(laberinto, fila, columna - 1, visitados) or
-        buscar_solucion_dfs_recursivo(laberinto, fila - 1, columna, visitados)):
-        return True
-    
-    ##! Se llega a un callejon sin salida y se borra el * marcado
-    if laberinto[fila][columna] != 'I':
-        laberinto[fila][columna] = ' '
-    return False
+# Orden de exploración: Derecha, Abajo, Izquierda, Arriba
+DIRECCIONES_DFS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+def buscar_camino_dfs(laberinto, inicio, observador=None):
+    """
+    DFS con pila explícita que no modifica el laberinto (sirve con vistas de solo
+    lectura). Como la pila guarda justo la rama actual, al llegar a 'F' la pila es
+    el camino.
+    Regresa (camino, nodos_visitados); el camino es None si no se llega a 'F'.
+    `observador` recibe los eventos de la búsqueda (ver IA/instrumentacion.py).
+    """
+    alto, ancho = len(laberinto), len(laberinto[0])
+    visitados = bytearray(alto * ancho) ## Un byte por celda, índice fila * ancho + columna
+    fila, columna = inicio
+    if laberinto[fila][columna] == 'F':
+        return [inicio], 0
+    if laberinto[fila][columna] == '#':
+        return None, 0
+
+    visitados[fila * ancho + columna] = 1
+    nodos_visitados = 1
+    pila = [(fila, columna, 0)] ## (fila, columna, siguiente dirección por probar)
+    # `visitados` mide lo mismo que la malla; al observador se le pasa un conjunto que sí crece
+    cerrados = {(fila, columna)} if observador is not None else None
+
+    while pila:
+        fila, columna, direccion = pila.pop()
+        if direccion == len(DIRECCIONES_DFS): ##! Callejón sin salida, se regresa
+            if observador is not None:
+                observador.podar((fila, columna))
+            continue
+        if direccion == 0 and observador is not None:
+            observador.expandir((fila, columna), pila, cerrados)
+        pila.append((fila, columna, direccion + 1))
+
+        df, dc = DIRECCIONES_DFS[direccion]
+        nueva_fila, nueva_columna = fila + df, columna + dc
+        if not (0 <= nueva_fila < alto and 0 <= nueva_columna < ancho): ##! La ubicacion esta fuera del mapa
+            continue
+        celda = laberinto[nueva_fila][nueva_columna]
+        indice = nueva_fila * ancho + nueva_columna
+        if celda == '#' or visitados[indice]: ##! La ubicacion es un muro o ya se visitó
+            continue
+        if celda == 'F': ##* La ubicacion es el final del laberinto
+            return [(f, c) for f, c, _ in pila] + [(nueva_fila, nueva_columna)], nodos_visitados
+
+        visitados[indice] = 1
+        nodos_visitados += 1
+        pila.append((nueva_fila, nueva_columna, 0))
+        if observador is not None:
+            cerrados.add((nueva_fila, nueva_columna))
+            observador.generar((nueva_fila, nueva_columna))
+
+    return None, nodos_visitados
+
+def buscar_solucion_dfs_iterativo(laberinto, inicio, observador=None):
+    """
+    DFS sin límite de recursión que deja marcado con '*' el camino encontrado
+    (los callejones sin salida quedan limpios).
+    Regresa (encontrado, nodos_visitados).
+    """
+    camino, nodos_visitados = buscar_camino_dfs(laberinto, inicio, observador)
+    if camino is None:
+        return False, nodos_visitados
+    for fila, columna in camino:
+        if laberinto[fila][columna] not in ('I', 'F'):
+            laberinto[fila][columna] = '*'
+    return True, nodos_visitados
 
 # --------------------------------------------------------------------------
 # ALGORITMO DE BÚSQUEDA EN ANCHURA (BFS)
 # --------------------------------------------------------------------------
 
-def resolver_con_bfs(laberinto):
-    inicio, _ = encontrar_puntos(laberinto)
-    if not inicio:
-        print("Error: No se encontró 'I'.")
-        return
+def reconstruir_camino(padres, fin):
+    """
+    Recorre los apuntadores al padre desde `fin` hasta el inicio (cuyo padre es None)
+    y regresa el camino en orden de inicio a fin.
+    """
+    camino = []
+    posicion = fin
+    while posicion is not None:
+        camino.append(posicion)
+        posicion = padres[posicion]
+    camino.reverse()
+    return camino
 
-    cola = collections.deque([[inicio]]) ## Cola de caminos
-    visitados = {inicio}
-    path_solucion = None
+def buscar_camino_bfs(laberinto, inicio, observador=None):
+    """
+    Búsqueda en anchura sin imprimir nada.
+    Regresa (camino, nodos_expandidos); el camino es None si no se llega a 'F'.
+    `observador` recibe los eventos de la búsqueda (ver IA/instrumentacion.py).
+    """
+    cola = collections.deque([inicio]) ## Cola de posiciones
+    padres = {inicio: None} ## Padre de cada posición descubierta; también sirve de visitados
+    nodos_expandidos = 0
 
     while cola:
-        camino_actual = cola.popleft()
-        fila, columna = camino_actual[-1]
+        fila, columna = cola.popleft()
+        nodos_expandidos += 1
+        if observador is not None:
+            observador.expandir((fila, columna), cola, padres)
 
         if laberinto[fila][columna] == 'F':
-            path_solucion = camino_actual
-            break
+            return reconstruir_camino(padres, (fila, columna)), nodos_expandidos
 
         for df, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]: # Derecha, Abajo, Izquierda, Arriba
             nueva_fila, nueva_columna = fila + df, columna + dc
             vecino = (nueva_fila, nueva_columna) # Vecino a explorar
 
             if (0 <= nueva_fila < len(laberinto) and 0 <= nueva_columna < len(laberinto[0]) and
-                laberinto[nueva_fila][nueva_columna] != '#' and vecino not in visitados): # Verifica que el vecino sea válido
-                visitados.add(vecino)
-                nuevo_camino = list(camino_actual)
-                nuevo_camino.append(vecino)
-                cola.append(nuevo_camino)
+                laberinto[nueva_fila][nueva_columna] != '#' and vecino not in padres): # Verifica que el vecino sea válido
+                padres[vecino] = (fila, columna)
+                cola.append(vecino)
+                if observador is not None:
+                    observador.generar(vecino)
+
+    return None, nodos_expandidos
+
+def resolver_con_bfs(laberinto):
+    inicio, _ = encontrar_puntos(laberinto)
+    if not inicio:
+        print("Error: No se encontró 'I'.")
+        return
 
+    path_solucion, _ = buscar_camino_bfs(laberinto, inicio)
     if path_solucion:
-        for fila, columna in path_solucion:
-            if laberinto[fila][columna] not in ('I', 'F'):
-                laberinto[fila][columna] = '*'
-        imprimir_laberinto(laberinto)
+        imprimir_laberinto(laberinto, path_solucion)
     else:
         print("No se pudo encontrar una solución con BFS.\n")
 
+def buscar_camino_bfs_bidireccional(laberinto, inicio, fin, observador=None):
+    """
+    BFS que crece una frontera desde 'I' y otra desde 'F', expandiendo siempre un
+    nivel completo de la más chica. En el primer nivel en que se tocan se toma el
+    mejor cruce de todo el nivel, así el camino sigue siendo el más corto.
+    Regresa (camino, nodos_expandidos) como buscar_camino_bfs.
+    """
+    if inicio == fin:
+        return [inicio], 1
+    # Índice 0: desde el inicio; índice 1: desde el fin. padres también sirve de visitados
+    padres = ({inicio: None}, {fin: None})
+    distancias = ({inicio: 0}, {fin: 0})
+    fronteras = ([inicio], [fin])
+    nodos_expandidos = 0
+    alto, ancho = len(laberinto), len(laberinto[0])
+
+    while fronteras[0] and fronteras[1]:
+        lado = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+        mis_padres, otros_padres = padres[lado], padres[1 - lado]
+        mis_distancias, otras_distancias = distancias[lado], distancias[1 - lado]
+        siguiente_frontera = []
+        mejor_cruce, mejor_longitud = None, None
+
+        for fila, columna in fronteras[lado]:
+            nodos_expandidos += 1
+            if observador is not None:
+                observador.expandir((fila, columna), siguiente_frontera, mis_padres)
+            for df, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]: # Derecha, Abajo, Izquierda, Arriba
+                vecino = (fila + df, columna + dc)
+                if not (0 <= vecino[0] < alto and 0 <= vecino[1] < ancho) or laberinto[vecino[0]][vecino[1]] == '#':
+                    continue
+                if vecino in otros_padres: ## Las dos búsquedas se tocan
+                    longitud = mis_distancias[(fila, columna)] + 1 + otras_distancias[vecino]
+                    if mejor_longitud is None or longitud < mejor_longitud:
+                        mejor_cruce, mejor_longitud = ((fila, columna), vecino), longitud
+                if vecino not in mis_padres:
+                    mis_padres[vecino] = (fila, columna)
+                    mis_distancias[vecino] = mis_distancias[(fila, columna)] + 1
+                    siguiente_frontera.append(vecino)
+                    if observador is not None:
+                        observador.generar(vecino)
+
+        if mejor_cruce is not None:
+            propio, ajeno = mejor_cruce
+            mitad_propia = reconstruir_camino(mis_padres, propio)
+            mitad_ajena = reconstruir_camino(otros_padres, ajeno)[::-1]
+            camino = mitad_propia + mitad_ajena
+            # La mitad propia empieza en el extremo de este lado; si es el fin, se voltea
+            return (camino if lado == 0 else camino[::-1]), nodos_expandidos
+        fronteras = (siguiente_frontera, fronteras[1]) if lado == 0 else (fronteras[0], siguiente_frontera)
+
+    return None, nodos_expandidos
+
+def resolver_con_bfs_bidireccional(laberinto):
+    inicio, fin = encontrar_puntos(laberinto)
+    if not inicio or not fin:
+        print("Error: No se encontró 'I' o 'F'.")
+        return
+
+    path_solucion, _ = buscar_camino_bfs_bidireccional(laberinto, inicio, fin)
+    if path_solucion:
+        imprimir_laberinto(laberinto, path_solucion)
+    else:
+        print("No se pudo encontrar una solución con BFS bidireccional.\n")
+
 # --------------------------------------------------------------------------
 # ALGORITMO DE BÚSQUEDA INFORMADA A* (A-Estrella)
 # --------------------------------------------------------------------------
@@ -131,59 +293,254 @@ def distancia_manhattan(punto1, punto2):
     """
     return abs(punto1[0] - punto2[0]) + abs(punto1[1] - punto2[1])
 
-def resolver_con_a_estrella(laberinto):
+class ColaPorCubetas:
     """
-    Prepara y ejecuta la solución usando el algoritmo A*.
+    Cola de prioridad para f enteras: una cubeta (lista usada como pila) por valor
+    de f. sacar() toma la f mínima y, dentro de ella, el último elemento agregado;
+    como los hijos entran después que sus padres, a igual f sale primero el más
+    profundo. En un laberinto f y g toman miles de valores, por eso no se abre una
+    lista por cada g como en el 15-puzzle.
+    Agregar y sacar cuestan O(1) amortizado en lugar del O(log n) del heap.
     """
-    inicio, fin = encontrar_puntos(laberinto)
-    if not inicio or not fin:
-        print("Error: No se encontró 'I' o 'F'.")
-        return
-    
-    # La cola de prioridad almacenará tuplas: (costo_f, costo_g, camino)
-    frontera = [(0, 0, [inicio])] # f=0, g=0, camino=[(inicio)]
-    visitados = set()
-    path_solucion = None
+    def __init__(self):
+        self.cubetas = [] # cubetas[f] -> lista de (g, elemento)
+        self.f_minima = 0
+        self.tamano = 0
+
+    def agregar(self, costo_f, costo_g, elemento):
+        while len(self.cubetas) <= costo_f:
+            self.cubetas.append([])
+        self.cubetas[costo_f].append((costo_g, elemento))
+        if costo_f < self.f_minima:
+            self.f_minima = costo_f
+        self.tamano += 1
+
+    def sacar(self):
+        """Devuelve (costo_f, costo_g, elemento) con la menor f, el último agregado entre empates"""
+        if not self.tamano:
+            raise IndexError("la cola está vacía")
+        costo_f = self.f_minima
+        while not self.cubetas[costo_f]:
+            costo_f += 1
+        self.f_minima = costo_f
+        self.tamano -= 1
+        costo_g, elemento = self.cubetas[costo_f].pop()
+        return costo_f, costo_g, elemento
+
+    def __len__(self):
+        return self.tamano
+
+def buscar_camino_a_estrella(laberinto, inicio, fin, observador=None):
+    """
+    Búsqueda A* sin imprimir nada.
+    Regresa (camino, nodos_expandidos); el camino es None si no se llega a 'F'.
+    `observador` recibe los eventos de la búsqueda (ver IA/instrumentacion.py).
+    """
+    # La cola de prioridad almacenará (posicion, padre) en la cubeta de su f y g
+    frontera = ColaPorCubetas()
+    frontera.agregar(distancia_manhattan(inicio, fin), 0, (inicio, None)) # g=0, el inicio no tiene padre
+    padres = {} # Se llena al expandir, así que también sirve de visitados
 
     while frontera:
-        # Sacamos el camino con el menor costo f(n) de la cola de prioridad
-        _, costo_g, camino_actual = heapq.heappop(frontera)
-        
-        posicion_actual = camino_actual[-1]
+        # Sacamos la posición con el menor costo f(n) (y a igual f, la más profunda)
+        _, costo_g, (posicion_actual, padre) = frontera.sacar()
 
-        if posicion_actual in visitados:
+        if posicion_actual in padres:
+            if observador is not None:
+                observador.podar(posicion_actual)
             continue
-        
-        visitados.add(posicion_actual)
+
+        padres[posicion_actual] = padre
+        if observador is not None:
+            observador.expandir(posicion_actual, frontera, padres)
 
         if posicion_actual == fin:
-            path_solucion = camino_actual
-            break
+            return reconstruir_camino(padres, fin), len(padres)
 
         # Explorar vecinos
         for df, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
             vecino = (posicion_actual[0] + df, posicion_actual[1] + dc)
             
             if (0 <= vecino[0] < len(laberinto) and 0 <= vecino[1] < len(laberinto[0]) and
-                laberinto[vecino[0]][vecino[1]] != '#' and vecino not in visitados):
+                laberinto[vecino[0]][vecino[1]] != '#' and vecino not in padres):
                 
                 nuevo_costo_g = costo_g + 1
                 heuristico_h = distancia_manhattan(vecino, fin)
                 costo_f = nuevo_costo_g + heuristico_h
                 
-                nuevo_camino = list(camino_actual)
-                nuevo_camino.append(vecino)
-                
-                heapq.heappush(frontera, (costo_f, nuevo_costo_g, nuevo_camino))
-    
+                frontera.agregar(costo_f, nuevo_costo_g, (vecino, posicion_actual))
+                if observador is not None:
+                    observador.generar(vecino)
+
+    return None, len(padres)
+
+def resolver_con_a_estrella(laberinto):
+    """
+    Prepara y ejecuta la solución usando el algoritmo A*.
+    """
+    inicio, fin = encontrar_puntos(laberinto)
+    if not inicio or not fin:
+        print("Error: No se encontró 'I' o 'F'.")
+        return
+
+    path_solucion, _ = buscar_camino_a_estrella(laberinto, inicio, fin)
     if path_solucion:
-        for fila, columna in path_solucion:
-            if laberinto[fila][columna] not in ('I', 'F'):
-                laberinto[fila][columna] = '*'
-        imprimir_laberinto(laberinto)
+        imprimir_laberinto(laberinto, path_solucion)
     else:
         print("No se pudo encontrar una solución con A*.\n")
 
+# --------------------------------------------------------------------------
+# JUMP POINT SEARCH (JPS) EN 4 DIRECCIONES
+# --------------------------------------------------------------------------
+
+def _signo(valor):
+    return (valor > 0) - (valor < 0)
+
+def _expandir_segmento(desde, hasta):
+    """Celdas de la línea recta entre dos puntos de salto, sin incluir `desde`"""
+    df, dc = _signo(hasta[0] - desde[0]), _signo(hasta[1] - desde[1])
+    fila, columna = desde
+    celdas = []
+    while (fila, columna) != hasta:
+        fila, columna = fila + df, columna + dc
+        celdas.append((fila, columna))
+    return celdas
+
+def buscar_camino_jps(laberinto, inicio, fin, observador=None):
+    """
+    A* que en lugar de expandir celda por celda salta en línea recta hasta el
+    siguiente punto de salto (una esquina, cruce o el fin). Los caminos rectos
+    por pasillos no se expanden, pero la longitud sigue siendo la óptima.
+    Regresa (camino, nodos_expandidos) como buscar_camino_a_estrella.
+    """
+    alto, ancho = len(laberinto), len(laberinto[0])
+
+    def libre(fila, columna):
+        return 0 <= fila < alto and 0 <= columna < ancho and laberinto[fila][columna] != '#'
+
+    # (fila, columna, dc) -> punto de salto (o None) al avanzar en horizontal desde esa celda.
+    # Todas las celdas de un mismo recorrido llegan al mismo punto, así que un recorrido
+    # llena el caché de todas ellas y saltar_vertical no vuelve a barrer la fila en cada paso.
+    saltos_horizontales = {}
+
+    # fila -> si puede tener puntos de salto horizontales: un vecino forzado necesita
+    # un muro en la fila de arriba o de abajo, y si no lo hay solo queda el fin
+    filas_con_saltos = {}
+
+    def puede_tener_saltos(fila):
+        if fila not in filas_con_saltos:
+            filas_con_saltos[fila] = (fila == fin[0] or (fila > 0 and '#' in laberinto[fila - 1]) or
+                                      (fila + 1 < alto and '#' in laberinto[fila + 1]))
+        return filas_con_saltos[fila]
+
+    def saltar_horizontal(fila, columna, dc):
+        if not 0 <= fila < alto or not puede_tener_saltos(fila):
+            return None
+        # Las tres filas se leen una vez; cada celda revisa arriba y abajo de ella y de la anterior
+        actual = laberinto[fila]
+        arriba = laberinto[fila - 1] if fila > 0 else None
+        abajo = laberinto[fila + 1] if fila + 1 < alto else None
+        recorridas = []
+        salto = None
+        while 0 <= columna < ancho and actual[columna] != '#':
+            clave = (fila, columna, dc)
+            if clave in saltos_horizontales:
+                salto = saltos_horizontales[clave]
+                break
+            recorridas.append(clave)
+            if (fila, columna) == fin:
+                salto = (fila, columna)
+                break
+            # Vecino forzado: se abre un paso arriba o abajo que antes estaba tapado
+            # (la celda anterior siempre está dentro del mapa: de ahí se llegó)
+            anterior = columna - dc
+            if ((arriba is not None and arriba[columna] != '#' and arriba[anterior] == '#') or
+                    (abajo is not None and abajo[columna] != '#' and abajo[anterior] == '#')):
+                salto = (fila, columna)
+                break
+            columna += dc
+        for clave in recorridas:
+            saltos_horizontales[clave] = salto
+        return salto
+
+    def saltar_vertical(fila, columna, df):
+        while libre(fila, columna):
+            if (fila, columna) == fin:
+                return fila, columna
+            if ((libre(fila, columna - 1) and not libre(fila - df, columna - 1)) or
+                    (libre(fila, columna + 1) and not libre(fila - df, columna + 1))):
+                return fila, columna
+            # Al moverse en vertical también es punto de salto si a un lado hay uno
+            if saltar_horizontal(fila, columna + 1, 1) or saltar_horizontal(fila, columna - 1, -1):
+                return fila, columna
+            fila += df
+        return None
+
+    def direcciones(posicion, padre):
+        """Direcciones que vale la pena seguir según de dónde se llegó (poda de JPS)"""
+        if padre is None:
+            return [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        df, dc = _signo(posicion[0] - padre[0]), _signo(posicion[1] - padre[1])
+        if dc:
+            return [(0, dc), (1, 0), (-1, 0)]
+        return [(0, 1), (df, 0), (0, -1)]
+
+    # La cola de prioridad almacenará (punto, padre) en la cubeta de su f; a igual f sale
+    # primero el último agregado, que es el más profundo
+    frontera = ColaPorCubetas()
+    frontera.agregar(distancia_manhattan(inicio, fin), 0, (inicio, None))
+    padres = {}
+
+    while frontera:
+        _, costo_g, (punto_actual, padre) = frontera.sacar()
+
+        if punto_actual in padres:
+            if observador is not None:
+                observador.podar(punto_actual)
+            continue
+
+        padres[punto_actual] = padre
+        if observador is not None:
+            observador.expandir(punto_actual, frontera, padres)
+
+        if punto_actual == fin:
+            puntos = reconstruir_camino(padres, fin)
+            camino = [puntos[0]]
+            for desde, hasta in zip(puntos, puntos[1:]):
+                camino.extend(_expandir_segmento(desde, hasta))
+            return camino, len(padres)
+
+        fila, columna = punto_actual
+        for df, dc in direcciones(punto_actual, padre):
+            if dc:
+                salto = saltar_horizontal(fila, columna + dc, dc)
+            else:
+                salto = saltar_vertical(fila + df, columna, df)
+            if salto is None or salto in padres:
+                continue
+            nuevo_costo_g = costo_g + distancia_manhattan(punto_actual, salto)
+            costo_f = nuevo_costo_g + distancia_manhattan(salto, fin)
+            frontera.agregar(costo_f, nuevo_costo_g, (salto, punto_actual))
+            if observador is not None:
+                observador.generar(salto)
+
+    return None, len(padres)
+
+def resolver_con_jps(laberinto):
+    """
+    Prepara y ejecuta la solución usando Jump Point Search.
+    """
+    inicio, fin = encontrar_puntos(laberinto)
+    if not inicio or not fin:
+        print("Error: No se encontró 'I' o 'F'.")
+        return
+
+    path_solucion, _ = buscar_camino_jps(laberinto, inicio, fin)
+    if path_solucion:
+        imprimir_laberinto(laberinto, path_solucion)
+    else:
+        print("No se pudo encontrar una solución con JPS.\n")
+
 # --------------------------------------------------------------------------
 # EJECUCIÓN PRINCIPAL
 # --------------------------------------------------------------------------
@@ -211,22 +568,32 @@ if __name__ == "__main__":
         ['#', ' ', '#', ' ', '#', '#', '#', '#', '#', '#', '#', ' ', '#', ' ', '#', '#', '#', '#', ' ', 'F'],
         ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#']
     ]
+    if len(sys.argv) > 1:
+        # python dfs.py laberinto.txt [--mmap]  (texto o formato de bits)
+        from archivo_laberinto import cargar_laberinto
+        laberinto_base = cargar_laberinto(sys.argv[1], usar_mmap='--mmap' in sys.argv[2:])
 
     print(Fore.CYAN + Style.BRIGHT + "--- Laberinto inicial --- \n")
 
     imprimir_laberinto(laberinto_base)
 
+    # Los solvers no modifican el laberinto (el camino se dibuja encima), así que no hace falta copiarlo
     # --- Ejecución de DFS ---
     print(Fore.YELLOW + Style.BRIGHT + "1. Solución con Búsqueda en Profundidad (DFS):")
-    laberinto_dfs = copy.deepcopy(laberinto_base)
-    resolver_con_dfs(laberinto_dfs)
+    resolver_con_dfs(laberinto_base)
     
     # --- Ejecución de BFS ---
     print(Fore.YELLOW + Style.BRIGHT + "2. Solución con Búsqueda en Anchura (BFS):")
-    laberinto_bfs = copy.deepcopy(laberinto_base)
-    resolver_con_bfs(laberinto_bfs)
+    resolver_con_bfs(laberinto_base)
     
     # --- Ejecución de A* ---
     print(Fore.YELLOW + Style.BRIGHT + "3. Solución con Búsqueda Informada (A*):")
-    laberinto_a_estrella = copy.deepcopy(laberinto_base)
-    resolver_con_a_estrella(laberinto_a_estrella)
\ No newline at end of file
+    resolver_con_a_estrella(laberinto_base)
+    
+    # --- Ejecución de JPS ---
+    print(Fore.YELLOW + Style.BRIGHT + "4. Solución con Jump Point Search (JPS):")
+    resolver_con_jps(laberinto_base)
+    
+    # --- Ejecución de BFS bidireccional ---
+    print(Fore.YELLOW + Style.BRIGHT + "5. Solución con BFS bidireccional:")
+    resolver_con_bfs_bidireccional(laberinto_base)
\ No newline at end of file
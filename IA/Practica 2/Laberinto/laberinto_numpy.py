@@ -0,0 +1,167 @@
+"""
+Laberinto representado como arreglo de NumPy (uint8) y BFS por frentes de onda.
+
+En lugar de sacar celdas de una cola una por una, cada paso del BFS expande el
+frente completo con operaciones de arreglos: se suman los desplazamientos de los
+cuatro vecinos a todos los índices del frente y se filtran con máscaras de
+celdas libres y no visitadas. El resultado es un campo de distancias desde 'I'
+con el que se puede leer el camino a 'F' (o a cualquier otra celda).
+"""
+import random
+import time
+
+import numpy as np
+
+from dfs import encontrar_puntos, imprimir_laberinto, buscar_camino_bfs
+
+# Códigos de celda de la malla
+MURO = 0
+LIBRE = 1
+INICIO = 2
+FIN = 3
+CODIGOS = {'#': MURO, ' ': LIBRE, '*': LIBRE, 'I': INICIO, 'F': FIN}
+
+# Distancia de las celdas a las que no se puede llegar
+INALCANZABLE = -1
+
+# Mismo orden de vecinos que en dfs.py: Derecha, Abajo, Izquierda, Arriba
+DIRECCIONES = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# --------------------------------------------------------------------------
+# CONVERSIÓN
+# --------------------------------------------------------------------------
+
+def crear_malla(laberinto):
+    """
+    Convierte la lista de listas de caracteres en un arreglo uint8 con los
+    códigos MURO/LIBRE/INICIO/FIN.
+    """
+    caracteres = np.array(laberinto, dtype='<U1')
+    malla = np.full(caracteres.shape, LIBRE, dtype=np.uint8)
+    for caracter, codigo in CODIGOS.items():
+        malla[caracteres == caracter] = codigo
+    return malla
+
+def encontrar_celda(malla, codigo):
+    """Primera celda (fila, columna) con el código dado, o None"""
+    posiciones = np.argwhere(malla == codigo)
+    if len(posiciones) == 0:
+        return None
+    return tuple(int(valor) for valor in posiciones[0])
+
+# --------------------------------------------------------------------------
+# BFS POR FRENTES DE ONDA
+# --------------------------------------------------------------------------
+
+def campo_distancias(malla, origen, observador=None):
+    """
+    Distancia en pasos desde `origen` a todas las celdas (INALCANZABLE si no hay camino).
+
+    La malla se rodea con un borde de muros y se trabaja con índices planos, así
+    los vecinos de un índice son índice + 1, + ancho, - 1 y - ancho sin revisar
+    límites. Cada frente cuesta O(tamaño del frente), no O(tamaño de la malla).
+
+    `observador` recibe los eventos de la búsqueda (ver IA/instrumentacion.py) celda
+    por celda, así que con él cada frente se recorre también en Python.
+    """
+    alto, ancho = malla.shape
+    ancho_borde = ancho + 2
+    libres = np.zeros((alto + 2) * ancho_borde, dtype=bool)
+    libres.reshape(alto + 2, ancho_borde)[1:-1, 1:-1] = malla != MURO
+    distancias = np.full(libres.shape, INALCANZABLE, dtype=np.int32)
+    desplazamientos = np.array([1, ancho_borde, -1, -ancho_borde], dtype=np.intp)
+
+    frontera = np.array([(origen[0] + 1) * ancho_borde + origen[1] + 1], dtype=np.intp)
+    distancias[frontera] = 0
+    distancia = 0
+    cerrados = set() if observador is not None else None
+    while frontera.size:
+        if observador is not None:
+            for indice in frontera.tolist():
+                cerrados.add(indice)
+                observador.expandir((indice // ancho_borde - 1, indice % ancho_borde - 1), frontera, cerrados)
+        distancia += 1
+        vecinos = (frontera[:, None] + desplazamientos).ravel()
+        vecinos = vecinos[libres[vecinos] & (distancias[vecinos] == INALCANZABLE)]
+        # Dos celdas del frente pueden compartir vecino
+        frontera = np.unique(vecinos)
+        distancias[frontera] = distancia
+        if observador is not None:
+            for indice in frontera.tolist():
+                observador.generar((indice // ancho_borde - 1, indice % ancho_borde - 1))
+
+    return distancias.reshape(alto + 2, ancho_borde)[1:-1, 1:-1].copy()
+
+def leer_camino(distancias, destino):
+    """
+    Camino de la celda con distancia 0 hasta `destino`, bajando por el campo de
+    distancias un paso a la vez. Regresa None si el destino es inalcanzable.
+    """
+    alto, ancho = distancias.shape
+    fila, columna = destino
+    distancia = int(distancias[fila, columna])
+    if distancia == INALCANZABLE:
+        return None
+
+    camino = [(fila, columna)]
+    while distancia > 0:
+        for df, dc in DIRECCIONES:
+            nueva_fila, nueva_columna = fila + df, columna + dc
+            if (0 <= nueva_fila < alto and 0 <= nueva_columna < ancho and
+                    distancias[nueva_fila, nueva_columna] == distancia - 1):
+                fila, columna = nueva_fila, nueva_columna
+                break
+        distancia -= 1
+        camino.append((fila, columna))
+    camino.reverse()
+    return camino
+
+def buscar_camino_vectorizado(malla, observador=None):
+    """
+    Equivalente a buscar_camino_bfs sobre la malla: regresa (camino, distancias),
+    donde el camino va de INICIO a FIN (None si no hay) y `distancias` es el campo
+    completo, reutilizable para consultar otros destinos.
+    """
+    inicio, fin = encontrar_celda(malla, INICIO), encontrar_celda(malla, FIN)
+    if inicio is None:
+        return None, None
+    distancias = campo_distancias(malla, inicio, observador)
+    camino = leer_camino(distancias, fin) if fin is not None else None
+    return camino, distancias
+
+def resolver_con_bfs_vectorizado(laberinto):
+    inicio, _ = encontrar_puntos(laberinto)
+    if not inicio:
+        print("Error: No se encontró 'I'.")
+        return
+
+    path_solucion, _ = buscar_camino_vectorizado(crear_malla(laberinto))
+    if path_solucion:
+        imprimir_laberinto(laberinto, path_solucion)
+    else:
+        print("No se pudo encontrar una solución con BFS vectorizado.\n")
+
+# --------------------------------------------------------------------------
+# EJECUCIÓN PRINCIPAL
+# --------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    # Mapa abierto de 1000 x 1000 con 25% de muros al azar, sin imprimirlo
+    generador = random.Random(2024)
+    lado = 1000
+    laberinto = [['#' if generador.random() < 0.25 else ' ' for _ in range(lado)] for _ in range(lado)]
+    laberinto[0][0] = 'I'
+    laberinto[lado - 1][lado - 1] = 'F'
+
+    inicio_tiempo = time.perf_counter()
+    camino_deque, _ = buscar_camino_bfs(laberinto, (0, 0))
+    tiempo_deque = time.perf_counter() - inicio_tiempo
+
+    inicio_tiempo = time.perf_counter()
+    camino_vectorizado, distancias = buscar_camino_vectorizado(crear_malla(laberinto))
+    tiempo_vectorizado = time.perf_counter() - inicio_tiempo
+
+    longitud = len(camino_vectorizado) - 1 if camino_vectorizado else None
+    print(f"BFS con deque:        {tiempo_deque:.3f} s, longitud {len(camino_deque) - 1 if camino_deque else None}")
+    print(f"BFS por frentes:      {tiempo_vectorizado:.3f} s, longitud {longitud}")
+    print(f"Celdas alcanzables desde 'I': {int(np.count_nonzero(distancias != INALCANZABLE))}")
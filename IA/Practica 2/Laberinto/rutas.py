@@ -0,0 +1,143 @@
+"""
+Servicio de rutas para muchas consultas sobre el mismo laberinto.
+
+El laberinto se carga una sola vez (incluyendo la búsqueda de 'I' y 'F') y cada
+consulta (origen, destino) se contesta con un campo de distancias BFS desde el
+origen. Los campos se guardan en un caché LRU: mientras el mapa no cambie, todas
+las consultas que salen del mismo origen (o llegan a él, porque el laberinto no
+es dirigido) se resuelven leyendo el camino, sin volver a buscar.
+"""
+import collections
+import random
+import time
+
+import numpy as np
+
+from laberinto_numpy import (CODIGOS, INALCANZABLE, MURO, INICIO, FIN, DIRECCIONES,
+                             crear_malla, encontrar_celda, campo_distancias, leer_camino)
+
+# Campos de distancias que se guardan antes de desalojar el menos usado
+MAX_CAMPOS_POR_DEFECTO = 32
+
+
+class ServicioRutas:
+    """
+    Contesta consultas de camino más corto sobre un laberinto fijo.
+
+    ruta() y distancia() usan el caché; cambiar_celda() actualiza el mapa y
+    descarta solo los campos que el cambio pudo afectar. `observador` recibe los
+    eventos de cada campo que se calcula; los aciertos de caché no generan eventos.
+    """
+    def __init__(self, laberinto, max_campos=MAX_CAMPOS_POR_DEFECTO, observador=None):
+        self.malla = crear_malla(laberinto)
+        self.alto, self.ancho = self.malla.shape
+        self.inicio = encontrar_celda(self.malla, INICIO)
+        self.fin = encontrar_celda(self.malla, FIN)
+        self.max_campos = max_campos
+        self.observador = observador
+        self.campos = collections.OrderedDict() # origen -> campo de distancias
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _campo(self, origen):
+        """Campo de distancias desde `origen`, del caché o recién calculado"""
+        campo = self.campos.get(origen)
+        if campo is not None:
+            self.campos.move_to_end(origen)
+            self.aciertos += 1
+            return campo
+        self.fallos += 1
+        campo = campo_distancias(self.malla, origen, self.observador)
+        self.campos[origen] = campo
+        if len(self.campos) > self.max_campos:
+            self.campos.popitem(last=False)
+        return campo
+
+    def _es_valida(self, celda):
+        fila, columna = celda
+        return 0 <= fila < self.alto and 0 <= columna < self.ancho and self.malla[fila, columna] != MURO
+
+    def ruta(self, origen=None, destino=None):
+        """
+        Camino más corto de `origen` a `destino` como lista de (fila, columna), o
+        None si no hay. Por defecto van de 'I' a 'F'.
+        """
+        origen = origen or self.inicio
+        destino = destino or self.fin
+        if origen is None or destino is None or not self._es_valida(origen) or not self._es_valida(destino):
+            return None
+        # Si ya hay un campo desde el destino se usa al revés en lugar de calcular otro
+        if origen not in self.campos and destino in self.campos:
+            camino = leer_camino(self._campo(destino), origen)
+            return camino[::-1] if camino else None
+        return leer_camino(self._campo(origen), destino)
+
+    def distancia(self, origen=None, destino=None):
+        """Longitud del camino más corto, o None si no hay"""
+        origen = origen or self.inicio
+        destino = destino or self.fin
+        if origen is None or destino is None or not self._es_valida(origen) or not self._es_valida(destino):
+            return None
+        if origen not in self.campos and destino in self.campos:
+            origen, destino = destino, origen
+        valor = int(self._campo(origen)[destino])
+        return None if valor == INALCANZABLE else valor
+
+    def cambiar_celda(self, fila, columna, caracter):
+        """
+        Cambia una celda del mapa ('#', ' ', 'I' o 'F') e invalida los campos afectados:
+        un muro nuevo solo afecta a los campos que llegaban a esa celda y una celda
+        abierta solo a los que llegaban a alguno de sus vecinos.
+        """
+        codigo = CODIGOS[caracter]
+        if self.malla[fila, columna] == codigo:
+            return
+        se_abre = self.malla[fila, columna] == MURO
+        se_cierra = codigo == MURO
+        self.malla[fila, columna] = codigo
+        celda = (fila, columna)
+        if codigo == INICIO:
+            self.inicio = celda
+        elif self.inicio == celda:
+            self.inicio = None
+        if codigo == FIN:
+            self.fin = celda
+        elif self.fin == celda:
+            self.fin = None
+        if not se_abre and not se_cierra: # Solo cambió la etiqueta, no los caminos
+            return
+
+        if se_abre:
+            celdas = [(fila + df, columna + dc) for df, dc in DIRECCIONES
+                      if 0 <= fila + df < self.alto and 0 <= columna + dc < self.ancho]
+        else:
+            celdas = [(fila, columna)]
+        afectados = [origen for origen, campo in self.campos.items()
+                     if any(campo[celda] != INALCANZABLE for celda in celdas)]
+        for origen in afectados:
+            del self.campos[origen]
+
+    def limpiar(self):
+        self.campos.clear()
+
+
+# --------------------------------------------------------------------------
+# EJECUCIÓN PRINCIPAL
+# --------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    generador = random.Random(2024)
+    lado = 400
+    laberinto = [['#' if generador.random() < 0.25 else ' ' for _ in range(lado)] for _ in range(lado)]
+    libres = [(i, j) for i in range(lado) for j in range(lado) if laberinto[i][j] != '#']
+    # Pocos depósitos y muchos agentes: las consultas comparten origen
+    depositos = generador.sample(libres, 8)
+    consultas = [(generador.choice(depositos), generador.choice(libres)) for _ in range(2000)]
+
+    servicio = ServicioRutas(laberinto)
+    inicio_tiempo = time.perf_counter()
+    encontradas = sum(servicio.ruta(origen, destino) is not None for origen, destino in consultas)
+    tiempo = time.perf_counter() - inicio_tiempo
+    print(f"{len(consultas)} consultas en {tiempo:.3f} s, {encontradas} con camino")
+    print(f"Aciertos de caché: {servicio.aciertos}, campos calculados: {servicio.fallos}")
+    print(f"Celdas libres: {int(np.count_nonzero(servicio.malla != MURO))}")
@@ -1,6 +1,15 @@
 import tkinter as tk
 from tkinter import messagebox
-import math
+import queue
+import random
+import threading
+
+import gato_engine
+
+# Tiempo máximo que la IA puede pensar cada jugada
+AI_TIME_BUDGET_MS = 1000
+# Cada cuánto revisa la GUI si el hilo de la IA ya terminó
+AI_POLL_INTERVAL_MS = 50
 
 class TicTacToe4x4:
     def __init__(self, root):
@@ -12,6 +21,18 @@ class TicTacToe4x4:
         self.human_player = 'X'
         self.ai_player = 'O'
         self.current_player = self.human_player
+        # Se conserva entre jugadas y partidas: las posiciones valen lo mismo siempre
+        self.transposition_table = gato_engine.TranspositionTable()
+        # Si ya se generó la solución completa (python gato_engine.py) la IA juega perfecto
+        self.solved_table = gato_engine.load_solved_table()
+
+        # La IA piensa en un hilo aparte y deja su jugada en esta cola; la GUI la revisa con after
+        self.ai_results = queue.Queue()
+        self.ai_search_id = 0
+        self.ai_cancel_event = threading.Event()
+        # Evita que una búsqueda cancelada y la siguiente usen la tabla de transposición a la vez
+        self.ai_search_lock = threading.Lock()
+        self.pending_ai_call = None
 
         self.buttons = [[None for _ in range(4)] for _ in range(4)]
         self.create_widgets()
@@ -60,28 +81,52 @@ class TicTacToe4x4:
             if not self.check_game_over():
                 self.current_player = self.ai_player
                 self.update_status("Turno de la computadora (O)...")
-                self.root.after(500, self.ai_move)
+                self.pending_ai_call = self.root.after(500, self.ai_move)
 
     def ai_move(self):
-        """Ejecuta el movimiento de la IA usando Minimax."""
-        if self.is_board_empty():
-            # Para el primer movimiento, la IA elige una esquina al azar.
-            # Esto mejora la velocidad inicial sin necesidad de calcular todo el árbol.
-            import random
-            i, j = random.choice([(0,0), (0,3), (3,0), (3,3)])
-        else:
-            best_score = -math.inf
-            best_move = None
-            for i in range(4):
-                for j in range(4):
-                    if self.board[i][j] == '':
-                        self.board[i][j] = self.ai_player
-                        score = self.minimax(0, False, -math.inf, math.inf)
-                        self.board[i][j] = ''
-                        if score > best_score:
-                            best_score = score
-                            best_move = (i, j)
-        
+        """Lanza la búsqueda de la IA en un hilo para no congelar la ventana."""
+        self.pending_ai_call = None
+        self.ai_search_id += 1
+        self.ai_cancel_event = threading.Event()
+        board = [row[:] for row in self.board]
+        threading.Thread(
+            target=self.search_ai_move, args=(board, self.ai_search_id, self.ai_cancel_event), daemon=True
+        ).start()
+        self.root.after(AI_POLL_INTERVAL_MS, self.poll_ai_move, self.ai_search_id)
+
+    def search_ai_move(self, board, search_id, cancel_event):
+        """Corre en el hilo de la IA: calcula la jugada sobre una copia del tablero (ver gato_engine)."""
+        with self.ai_search_lock:
+            if cancel_event.is_set():
+                return
+            if self.is_board_empty(board):
+                # Para el primer movimiento, la IA elige una esquina al azar.
+                # Esto mejora la velocidad inicial sin necesidad de calcular todo el árbol.
+                best_move = random.choice([(0,0), (0,3), (3,0), (3,3)])
+            elif self.solved_table is not None:
+                best_move = gato_engine.perfect_move(board, self.solved_table)
+            else:
+                best_move, _ = gato_engine.timed_best_move(board, self.ai_player, self.human_player,
+                                                           AI_TIME_BUDGET_MS, self.transposition_table,
+                                                           cancel_event)
+        if not cancel_event.is_set():
+            self.ai_results.put((search_id, best_move))
+
+    def poll_ai_move(self, search_id):
+        """Revisa desde el hilo de Tk si ya llegó la jugada de la IA."""
+        if search_id != self.ai_search_id:
+            # El juego se reinició mientras la IA pensaba
+            return
+        try:
+            result_id, best_move = self.ai_results.get_nowait()
+        except queue.Empty:
+            self.root.after(AI_POLL_INTERVAL_MS, self.poll_ai_move, search_id)
+            return
+        if result_id != search_id:
+            # Resultado atrasado de una búsqueda anterior a un reinicio: se descarta
+            self.root.after(AI_POLL_INTERVAL_MS, self.poll_ai_move, search_id)
+            return
+
         if best_move:
             self.make_move(best_move[0], best_move[1], self.ai_player)
             self.check_game_over()
@@ -95,23 +140,9 @@ class TicTacToe4x4:
 
     def check_winner(self):
         """Verifica si hay un ganador."""
-        # Verificar filas y columnas
-        for i in range(4):
-            if all(self.board[i][j] == self.human_player for j in range(4)) or \
-               all(self.board[j][i] == self.human_player for j in range(4)):
-                return self.human_player
-            if all(self.board[i][j] == self.ai_player for j in range(4)) or \
-               all(self.board[j][i] == self.ai_player for j in range(4)):
-                return self.ai_player
-        
-        # Verificar diagonales
-        if all(self.board[i][i] == self.human_player for i in range(4)) or \
-           all(self.board[i][3-i] == self.human_player for i in range(4)):
-            return self.human_player
-        if all(self.board[i][i] == self.ai_player for i in range(4)) or \
-           all(self.board[i][3-i] == self.ai_player for i in range(4)):
-            return self.ai_player
-
+        for player in (self.human_player, self.ai_player):
+            if gato_engine.is_winner(gato_engine.board_to_mask(self.board, player)):
+                return player
         return None
 
     def is_board_full(self):
@@ -133,19 +164,14 @@ class TicTacToe4x4:
     def highlight_winner(self, winner):
         """Resalta la línea ganadora."""
         color = "#2ecc71"
-        # Filas
-        for i in range(4):
-            if all(self.board[i][j] == winner for j in range(4)):
-                for j in range(4): self.buttons[i][j].config(bg=color)
-        # Columnas
-        for j in range(4):
-            if all(self.board[i][j] == winner for i in range(4)):
-                for i in range(4): self.buttons[i][j].config(bg=color)
-        # Diagonales
-        if all(self.board[i][i] == winner for i in range(4)):
-            for i in range(4): self.buttons[i][i].config(bg=color)
-        if all(self.board[i][3-i] == winner for i in range(4)):
-            for i in range(4): self.buttons[i][3-i].config(bg=color)
+        mask = gato_engine.board_to_mask(self.board, winner)
+        # Puede haber más de una línea completa, se resaltan todas
+        for line in gato_engine.LINES:
+            if mask & line == line:
+                for i in range(4):
+                    for j in range(4):
+                        if line >> (i * 4 + j) & 1:
+                            self.buttons[i][j].config(bg=color)
 
     def end_game(self, message):
         """Finaliza el juego mostrando un mensaje y deshabilitando los botones."""
@@ -157,6 +183,12 @@ class TicTacToe4x4:
 
     def reset_game(self):
         """Reinicia el juego a su estado inicial."""
+        # Aborta la búsqueda de la IA en curso (o la que estaba por empezar)
+        self.ai_cancel_event.set()
+        self.ai_search_id += 1
+        if self.pending_ai_call is not None:
+            self.root.after_cancel(self.pending_ai_call)
+            self.pending_ai_call = None
         self.board = [['' for _ in range(4)] for _ in range(4)]
         self.current_player = self.human_player
         for i in range(4):
@@ -164,58 +196,10 @@ class TicTacToe4x4:
                 self.buttons[i][j].config(text='', state='normal', bg="#ecf0f1")
         self.update_status("Tu turno (X)")
 
-    def is_board_empty(self):
-        """Verifica si el tablero está completamente vacío."""
-        return all(self.board[i][j] == '' for i in range(4) for j in range(4))
-
-    def minimax(self, depth, is_maximizing, alpha, beta):
-        """
-        Algoritmo Minimax con poda Alfa-Beta.
-        Retorna la mejor puntuación para el estado actual del tablero.
-        """
-        winner = self.check_winner()
-        if winner == self.ai_player:
-            return 10 - depth  # Premiar victorias más rápidas
-        if winner == self.human_player:
-            return depth - 10  # Castigar derrotas más rápidas
-        if self.is_board_full():
-            return 0
-        
-        # Un límite de profundidad es crucial en un tablero 4x4 para evitar
-        # que el cálculo sea demasiado lento.
-        if depth > 4: 
-            return 0
-
-        if is_maximizing:
-            max_eval = -math.inf
-            for i in range(4):
-                for j in range(4):
-                    if self.board[i][j] == '':
-                        self.board[i][j] = self.ai_player
-                        evaluation = self.minimax(depth + 1, False, alpha, beta)
-                        self.board[i][j] = ''
-                        max_eval = max(max_eval, evaluation)
-                        alpha = max(alpha, evaluation)
-                        if beta <= alpha:
-                            break
-                if beta <= alpha:
-                    break
-            return max_eval
-        else:
-            min_eval = math.inf
-            for i in range(4):
-                for j in range(4):
-                    if self.board[i][j] == '':
-                        self.board[i][j] = self.human_player
-                        evaluation = self.minimax(depth + 1, True, alpha, beta)
-                        self.board[i][j] = ''
-                        min_eval = min(min_eval, evaluation)
-                        beta = min(beta, evaluation)
-                        if beta <= alpha:
-                            break
-                if beta <= alpha:
-                    break
-            return min_eval
+    def is_board_empty(self, board=None):
+        """Verifica si el tablero (por defecto self.board) está completamente vacío."""
+        board = self.board if board is None else board
+        return all(board[i][j] == '' for i in range(4) for j in range(4))
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,715 @@
+"""
+Motor del gato 4x4 con tableros de bits, sin dependencias de Tkinter.
+
+Cada jugador se representa con una máscara de 16 bits: el bit fila * 4 + columna
+está encendido si el jugador tiene ficha en esa casilla. Una línea ganadora se
+detecta con un solo AND contra su máscara precalculada.
+"""
+import collections
+import concurrent.futures
+import math
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+
+BOARD_SIZE = 4
+FULL_BOARD = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1
+
+# Las 10 líneas ganadoras: 4 filas, 4 columnas y 2 diagonales
+LINES = tuple(
+    [sum(1 << (i * BOARD_SIZE + j) for j in range(BOARD_SIZE)) for i in range(BOARD_SIZE)] +
+    [sum(1 << (j * BOARD_SIZE + i) for j in range(BOARD_SIZE)) for i in range(BOARD_SIZE)] +
+    [sum(1 << (i * BOARD_SIZE + i) for i in range(BOARD_SIZE)),
+     sum(1 << (i * BOARD_SIZE + BOARD_SIZE - 1 - i) for i in range(BOARD_SIZE))]
+)
+
+# Las 8 simetrías del tablero (rotaciones y reflejos) como funciones sobre (fila, columna)
+_N = BOARD_SIZE - 1
+SYMMETRIES = (
+    lambda i, j: (i, j), lambda i, j: (j, _N - i), lambda i, j: (_N - i, _N - j), lambda i, j: (_N - j, i),
+    lambda i, j: (i, _N - j), lambda i, j: (_N - i, j), lambda i, j: (j, i), lambda i, j: (_N - j, _N - i),
+)
+
+def _symmetry_byte_tables(symmetry):
+    """Tablas para transformar una máscara por bytes: T(m) = bajo[m & 0xFF] | alto[m >> 8]"""
+    tables = []
+    for offset in (0, 8):
+        table = []
+        for byte in range(256):
+            mask = 0
+            for bit in range(8):
+                if byte >> bit & 1:
+                    i, j = divmod(offset + bit, BOARD_SIZE)
+                    ti, tj = symmetry(i, j)
+                    mask |= 1 << (ti * BOARD_SIZE + tj)
+            table.append(mask)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+SYMMETRY_TABLES = tuple(_symmetry_byte_tables(symmetry) for symmetry in SYMMETRIES)
+
+# Puntuación de una victoria; se le resta la profundidad para premiar las más rápidas
+WIN_SCORE = 100
+# Igual que en la versión original: más allá de esta profundidad la posición vale 0
+MAX_DEPTH = 4
+
+
+def board_to_mask(board, player):
+    """Convierte el tablero de la GUI (lista de listas de 'X', 'O' o '') en la máscara de un jugador"""
+    mask = 0
+    for i in range(BOARD_SIZE):
+        for j in range(BOARD_SIZE):
+            if board[i][j] == player:
+                mask |= 1 << (i * BOARD_SIZE + j)
+    return mask
+
+def is_winner(mask):
+    for line in LINES:
+        if mask & line == line:
+            return True
+    return False
+
+# ----------------------------------------------------------------------
+# TABLA DE TRANSPOSICIÓN
+# ----------------------------------------------------------------------
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+DEFAULT_TABLE_SIZE = 1 << 20
+
+def canonical_key(ai, human, is_maximizing):
+    """
+    Clave común a las 8 posiciones simétricas: la menor de las transformaciones de
+    (ai, human), más un bit con el turno.
+    """
+    key = None
+    for low, high in SYMMETRY_TABLES:
+        candidate = ((low[ai & 0xFF] | high[ai >> 8]) << 16) | low[human & 0xFF] | high[human >> 8]
+        if key is None or candidate < key:
+            key = candidate
+    return key << 1 | is_maximizing
+
+class TranspositionTable:
+    """
+    Tabla de transposición acotada a max_entries; al llenarse desaloja la entrada usada
+    hace más tiempo. Cada entrada es (horizonte, puntuación relativa, tipo de cota).
+    """
+    def __init__(self, max_entries=DEFAULT_TABLE_SIZE):
+        self.max_entries = max_entries
+        self.entries = collections.OrderedDict()
+
+    def lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key, horizon, score, flag):
+        self.entries[key] = (horizon, score, flag)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+def _score_to_table(score, depth):
+    """Guarda las victorias como distancia desde el nodo, no desde la raíz de la búsqueda"""
+    if score > 0:
+        return score + depth
+    if score < 0:
+        return score - depth
+    return score
+
+def _score_from_table(score, depth):
+    if score > 0:
+        return score - depth
+    if score < 0:
+        return score + depth
+    return score
+
+def _horizon(depth, empty_cells, max_depth):
+    """
+    Jugadas que todavía puede explorar la búsqueda desde este nodo. Si alcanza para
+    llenar el tablero el corte no influye y el valor sirve a cualquier profundidad.
+    """
+    if max_depth is None:
+        return empty_cells
+    return min(max_depth - depth + 1, empty_cells)
+
+def _probe_table(table, key, horizon, depth, alpha, beta):
+    """
+    Consulta la tabla. Regresa (puntuación, alpha, beta): la puntuación no es None si
+    basta para responder; si no, alpha y beta pueden venir ajustados por una cota.
+    Solo se usan entradas calculadas con el mismo horizonte para que el valor sea idéntico.
+    """
+    entry = table.lookup(key)
+    if entry is None or entry[0] != horizon:
+        return None, alpha, beta
+    score = _score_from_table(entry[1], depth)
+    if entry[2] == EXACT:
+        return score, alpha, beta
+    if entry[2] == LOWER_BOUND:
+        alpha = max(alpha, score)
+    else:
+        beta = min(beta, score)
+    if beta <= alpha:
+        return score, alpha, beta
+    return None, alpha, beta
+
+def _store_table(table, key, horizon, depth, score, alpha, beta):
+    """Guarda la puntuación con el tipo de cota según la ventana (alpha, beta) usada al buscar"""
+    if score <= alpha:
+        flag = UPPER_BOUND
+    elif score >= beta:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    table.store(key, horizon, _score_to_table(score, depth), flag)
+
+def minimax(ai, human, depth, is_maximizing, alpha, beta, max_depth=MAX_DEPTH, table=None, observer=None):
+    """
+    Minimax con poda Alfa-Beta sobre máscaras de bits.
+    Mismas reglas de puntuación que TicTacToe4x4: victoria de la IA = WIN_SCORE - depth,
+    victoria del humano = depth - WIN_SCORE, empate o corte por profundidad = 0.
+    max_depth=None quita el corte. Con `table` se reutilizan posiciones ya evaluadas
+    (incluidas sus simétricas) sin cambiar el resultado. `observer` recibe los eventos
+    de expansión, generación y poda (ver IA/instrumentacion.py).
+    """
+    if is_winner(ai):
+        return WIN_SCORE - depth
+    if is_winner(human):
+        return depth - WIN_SCORE
+    occupied = ai | human
+    if occupied == FULL_BOARD:
+        return 0
+    if max_depth is not None and depth > max_depth:
+        return 0
+
+    # Las casillas libres se recorren del bit más bajo al más alto, es decir, por filas
+    empty = FULL_BOARD & ~occupied
+    if table is not None:
+        key = canonical_key(ai, human, is_maximizing)
+        horizon = _horizon(depth, bin(empty).count('1'), max_depth)
+        score, alpha, beta = _probe_table(table, key, horizon, depth, alpha, beta)
+        if score is not None:
+            return score
+        alpha_window, beta_window = alpha, beta
+    if observer is not None:
+        observer.expandir((ai, human), None, table.entries if table is not None else None)
+
+    if is_maximizing:
+        best_eval = -math.inf
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            if observer is not None:
+                observer.generar((ai | bit, human))
+            evaluation = minimax(ai | bit, human, depth + 1, False, alpha, beta, max_depth, table, observer)
+            best_eval = max(best_eval, evaluation)
+            alpha = max(alpha, evaluation)
+            if beta <= alpha:
+                if observer is not None:
+                    observer.podar((ai, human))
+                break
+    else:
+        best_eval = math.inf
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            if observer is not None:
+                observer.generar((ai, human | bit))
+            evaluation = minimax(ai, human | bit, depth + 1, True, alpha, beta, max_depth, table, observer)
+            best_eval = min(best_eval, evaluation)
+            beta = min(beta, evaluation)
+            if beta <= alpha:
+                if observer is not None:
+                    observer.podar((ai, human))
+                break
+
+    if table is not None:
+        _store_table(table, key, horizon, depth, best_eval, alpha_window, beta_window)
+    return best_eval
+
+def best_move(board, ai_player='O', human_player='X', max_depth=MAX_DEPTH, table=None, observer=None):
+    """
+    Regresa la mejor jugada (fila, columna) para ai_player, o None si no hay casillas libres.
+    Cada jugada de la raíz se evalúa con ventana completa, como en TicTacToe4x4.ai_move.
+    Conviene reutilizar la misma `table` entre jugadas de una partida.
+    """
+    ai = board_to_mask(board, ai_player)
+    human = board_to_mask(board, human_player)
+    empty = FULL_BOARD & ~(ai | human)
+
+    best_score = -math.inf
+    best = None
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        score = minimax(ai | bit, human, 0, False, -math.inf, math.inf, max_depth, table, observer)
+        if score > best_score:
+            best_score = score
+            best = bit
+    if best is None:
+        return None
+    return divmod(best.bit_length() - 1, BOARD_SIZE)
+
+# ----------------------------------------------------------------------
+# PROFUNDIZACIÓN ITERATIVA CON LÍMITE DE TIEMPO
+# ----------------------------------------------------------------------
+
+DEFAULT_TIME_BUDGET_MS = 1000
+# Cada cuántos nodos se revisa el reloj
+TIME_CHECK_INTERVAL = 512
+
+class SearchTimeout(Exception):
+    pass
+
+class SearchCancelled(Exception):
+    pass
+
+class IterativeDeepeningSearch:
+    """
+    Repite la búsqueda con max_depth = 0, 1, 2, ... hasta agotar el presupuesto de tiempo
+    y se queda con la jugada de la última profundidad completada.
+    Las jugadas se ordenan con la variante principal de la iteración anterior, dos
+    jugadas asesinas por profundidad y una tabla de historia por jugador y casilla.
+    `cancel_event` (por ejemplo un threading.Event) permite abortar la búsqueda desde
+    otro hilo; en ese caso best_move regresa (None, None). `observer` recibe los
+    eventos de la búsqueda como en minimax().
+    """
+    def __init__(self, time_budget_ms=DEFAULT_TIME_BUDGET_MS, table=None, cancel_event=None, observer=None):
+        self.time_budget_ms = time_budget_ms
+        self.table = table
+        self.cancel_event = cancel_event
+        self.observer = observer
+        self.deadline = None
+        self.nodes = 0
+        self.previous_pv = []
+        self.pv = [[] for _ in range(FULL_BOARD.bit_length() + 1)]
+        self.killers = [[0, 0] for _ in range(FULL_BOARD.bit_length() + 1)]
+        self.history = [[0] * FULL_BOARD.bit_length(), [0] * FULL_BOARD.bit_length()]
+
+    def order_moves(self, empty, depth, is_maximizing):
+        """Regresa las casillas libres (como bits) en el orden en que conviene probarlas"""
+        moves = []
+        remaining = empty
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            moves.append(bit)
+        history = self.history[is_maximizing]
+        moves.sort(key=lambda bit: -history[bit.bit_length() - 1])
+
+        # Delante van la jugada de la variante principal y luego las asesinas, si son legales
+        first = []
+        if depth < len(self.previous_pv) and self.previous_pv[depth] & empty:
+            first.append(self.previous_pv[depth])
+        for killer in self.killers[depth]:
+            if killer & empty and killer not in first:
+                first.append(killer)
+        if first:
+            moves = first + [bit for bit in moves if bit not in first]
+        return moves
+
+    def minimax(self, ai, human, depth, is_maximizing, alpha, beta, max_depth):
+        """Igual que minimax() pero con ordenamiento de jugadas y revisión del reloj"""
+        self.nodes += 1
+        if self.nodes % TIME_CHECK_INTERVAL == 0:
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise SearchCancelled()
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+        self.pv[depth + 1] = []
+
+        if is_winner(ai):
+            return WIN_SCORE - depth
+        if is_winner(human):
+            return depth - WIN_SCORE
+        occupied = ai | human
+        if occupied == FULL_BOARD:
+            return 0
+        if depth > max_depth:
+            return 0
+
+        empty = FULL_BOARD & ~occupied
+        table = self.table
+        if table is not None:
+            key = canonical_key(ai, human, is_maximizing)
+            horizon = _horizon(depth, bin(empty).count('1'), max_depth)
+            score, alpha, beta = _probe_table(table, key, horizon, depth, alpha, beta)
+            if score is not None:
+                return score
+            alpha_window, beta_window = alpha, beta
+        observer = self.observer
+        if observer is not None:
+            observer.expandir((ai, human), None, table.entries if table is not None else None)
+
+        best_eval = -math.inf if is_maximizing else math.inf
+        for bit in self.order_moves(empty, depth, is_maximizing):
+            if observer is not None:
+                observer.generar((ai | bit, human) if is_maximizing else (ai, human | bit))
+            if is_maximizing:
+                evaluation = self.minimax(ai | bit, human, depth + 1, False, alpha, beta, max_depth)
+                improved = evaluation > best_eval
+                if improved:
+                    best_eval = evaluation
+                alpha = max(alpha, evaluation)
+            else:
+                evaluation = self.minimax(ai, human | bit, depth + 1, True, alpha, beta, max_depth)
+                improved = evaluation < best_eval
+                if improved:
+                    best_eval = evaluation
+                beta = min(beta, evaluation)
+            if improved:
+                self.pv[depth + 1] = [bit] + self.pv[depth + 2]
+            if beta <= alpha:
+                # Corte: la jugada se recuerda como asesina y suma a la historia
+                if observer is not None:
+                    observer.podar((ai, human))
+                killers = self.killers[depth]
+                if killers[0] != bit:
+                    killers[1] = killers[0]
+                    killers[0] = bit
+                self.history[is_maximizing][bit.bit_length() - 1] += (max_depth - depth + 1) ** 2
+                break
+
+        if table is not None:
+            _store_table(table, key, horizon, depth, best_eval, alpha_window, beta_window)
+        return best_eval
+
+    def search_root(self, ai, human, max_depth, root_moves):
+        """Una iteración completa; regresa [(puntuación, bit)] ordenadas de mejor a peor"""
+        alpha = -math.inf
+        best_score, best = -math.inf, None
+        scored = []
+        for bit in root_moves:
+            score = self.minimax(ai | bit, human, 0, False, alpha, math.inf, max_depth)
+            scored.append((score, bit))
+            if score > best_score:
+                best_score, best = score, bit
+                self.pv[0] = [bit] + self.pv[1]
+            alpha = max(alpha, score)
+        # La mejor primero; el resto conserva el orden en que se evaluaron
+        scored.sort(key=lambda item: item[1] != best)
+        return scored
+
+    def best_move(self, ai, human):
+        """Regresa (bit de la mejor jugada, última profundidad completada)"""
+        empty = FULL_BOARD & ~(ai | human)
+        empty_cells = bin(empty).count('1')
+        if not empty:
+            return None, None
+        root_moves = []
+        remaining = empty
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            root_moves.append(bit)
+
+        start = time.perf_counter()
+        best, completed_depth = None, None
+        for max_depth in range(empty_cells):
+            # La primera iteración siempre se completa para tener alguna jugada
+            self.deadline = start + self.time_budget_ms / 1000 if best is not None else None
+            try:
+                scored = self.search_root(ai, human, max_depth, root_moves)
+            except SearchTimeout:
+                break
+            except SearchCancelled:
+                self.deadline = None
+                return None, None
+            best, completed_depth = scored[0][1], max_depth
+            root_moves = [bit for _, bit in scored]
+            self.previous_pv = self.pv[0][1:]
+            # Se termina si el horizonte ya llega al final de la partida en todas las ramas
+            # o si se encontró una victoria o derrota forzada (buscar más no la cambia)
+            if max_depth + 1 >= empty_cells - 1 or scored[0][0] != 0:
+                break
+        self.deadline = None
+        return best, completed_depth
+
+def timed_best_move(board, ai_player='O', human_player='X', time_budget_ms=DEFAULT_TIME_BUDGET_MS, table=None,
+                    cancel_event=None, observer=None):
+    """
+    Mejor jugada (fila, columna) que cabe en time_budget_ms usando profundización iterativa.
+    Regresa ((fila, columna), profundidad completada); la jugada es None si el tablero está
+    lleno o si se activó cancel_event.
+    """
+    ai = board_to_mask(board, ai_player)
+    human = board_to_mask(board, human_player)
+    search = IterativeDeepeningSearch(time_budget_ms, table, cancel_event, observer)
+    best, completed_depth = search.best_move(ai, human)
+    if best is None:
+        return None, completed_depth
+    return divmod(best.bit_length() - 1, BOARD_SIZE), completed_depth
+
+# ----------------------------------------------------------------------
+# BÚSQUEDA PARALELA EN LA RAÍZ
+# ----------------------------------------------------------------------
+# La primera jugada de la raíz se evalúa en el proceso principal para tener un
+# alpha real (young brothers wait); las demás se reparten entre procesos. Los
+# procesos comparten la mejor puntuación encontrada hasta el momento (el alpha de
+# la raíz) y la vuelven a leer antes de cada respuesta del humano, así una mejora
+# de un proceso poda también los subárboles que a los demás les faltan. El tablero
+# viaja como dos enteros, que se serializan sin problema.
+
+# Valor del alpha compartido mientras ninguna jugada ha terminado
+_NO_ALPHA = -(WIN_SCORE + 1)
+_shared_alpha = None
+_worker_table = None
+
+def _init_worker(shared_alpha):
+    global _shared_alpha, _worker_table
+    _shared_alpha = shared_alpha
+    _worker_table = TranspositionTable()
+
+class _NodeCounter:
+    """Observador mínimo que solo cuenta nodos expandidos (viaja bien entre procesos)"""
+    def __init__(self):
+        self.nodes = 0
+
+    def expandir(self, node, frontier=None, closed=None):
+        self.nodes += 1
+
+    def generar(self, node):
+        pass
+
+    def podar(self, node=None):
+        pass
+
+def _read_shared_alpha():
+    alpha = _shared_alpha.value
+    # Se busca con alpha - 1 para que un empate con el mejor actual dé su valor exacto
+    # y el desempate (primera jugada en orden de filas) sea igual al de best_move
+    return -math.inf if alpha == _NO_ALPHA else alpha - 1
+
+def _evaluate_root_move(ai, human, bit, max_depth):
+    """
+    Se ejecuta en un proceso del pool; regresa (bit, puntuación, nodos).
+    El nodo de la jugada (turno del humano) se recorre aquí y no dentro de minimax
+    para leer el alpha compartido antes de cada respuesta. Si la puntuación queda
+    por debajo del alpha usado es solo una cota, pero entonces esa jugada ya no
+    puede ser la mejor.
+    """
+    counter = _NodeCounter()
+    ai |= bit
+    occupied = ai | human
+    if (is_winner(ai) or is_winner(human) or occupied == FULL_BOARD or
+            (max_depth is not None and max_depth < 0)):
+        score = minimax(ai, human, 0, False, -math.inf, math.inf, max_depth, _worker_table, counter)
+    else:
+        counter.nodes += 1
+        score = math.inf
+        empty = FULL_BOARD & ~occupied
+        while empty:
+            reply = empty & -empty
+            empty ^= reply
+            alpha = _read_shared_alpha()
+            score = min(score, minimax(ai, human | reply, 1, True, alpha, score, max_depth, _worker_table, counter))
+            if score <= alpha:
+                break
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return bit, score, counter.nodes
+
+class ParallelRootSearch:
+    """
+    Pool de procesos reutilizable entre jugadas. Elige siempre la misma jugada que
+    best_move con el mismo max_depth. Se usa como context manager o llamando a close().
+    Después de cada best_move, `nodes` tiene los nodos expandidos por todos los procesos.
+    El `observer` de best_move solo ve la raíz (su expansión y cada jugada enviada al
+    pool): los subárboles se buscan en otros procesos, a donde no se puede mandar un
+    observador con archivos o callbacks abiertos.
+    """
+    def __init__(self, max_workers=None):
+        self.shared_alpha = multiprocessing.Value('i', _NO_ALPHA)
+        self.table = TranspositionTable()
+        self.nodes = 0
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(self.shared_alpha,)
+        )
+
+    def best_move(self, board, ai_player='O', human_player='X', max_depth=MAX_DEPTH, observer=None):
+        ai = board_to_mask(board, ai_player)
+        human = board_to_mask(board, human_player)
+        empty = FULL_BOARD & ~(ai | human)
+        if observer is not None:
+            observer.expandir((ai, human))
+        if not empty:
+            return None
+
+        # La primera jugada se busca aquí con ventana completa; su valor es el alpha inicial
+        first = empty & -empty
+        empty ^= first
+        if observer is not None:
+            observer.generar((ai | first, human))
+        counter = _NodeCounter()
+        best_score = minimax(ai | first, human, 0, False, -math.inf, math.inf, max_depth, self.table, counter)
+        best = first
+        self.nodes = counter.nodes
+        with self.shared_alpha.get_lock():
+            self.shared_alpha.value = best_score
+
+        futures = []
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            if observer is not None:
+                observer.generar((ai | bit, human))
+            futures.append(self.executor.submit(_evaluate_root_move, ai, human, bit, max_depth))
+
+        # Los resultados se recorren en orden de filas para desempatar igual que best_move
+        for future in futures:
+            bit, score, nodes = future.result()
+            self.nodes += nodes
+            if score > best_score:
+                best_score, best = score, bit
+        return divmod(best.bit_length() - 1, BOARD_SIZE)
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def parallel_best_move(board, ai_player='O', human_player='X', max_depth=MAX_DEPTH, max_workers=None,
+                       observer=None):
+    """Como best_move, pero repartiendo las jugadas de la raíz entre procesos"""
+    with ParallelRootSearch(max_workers) as search:
+        return search.best_move(board, ai_player, human_player, max_depth, observer)
+
+# ----------------------------------------------------------------------
+# SOLUCIÓN COMPLETA DEL JUEGO (TABLA DE 2 BITS)
+# ----------------------------------------------------------------------
+# Cada posición se indexa en base 3 (0 = libre, 1 = X, 2 = O en la casilla i vale
+# 3**i) y guarda su valor para el jugador en turno en 2 bits. X siempre empieza,
+# así que el turno se deduce de cuántas fichas hay. Solo se guarda la posición
+# canónica de cada clase de simetría: la de menor índice entre las 8.
+
+UNKNOWN, LOSS, DRAW, WIN = 0, 1, 2, 3
+TABLE_ENTRIES = 3 ** (BOARD_SIZE * BOARD_SIZE)
+SOLVED_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gato4x4_solucion.bin")
+
+def _base3_byte_tables(symmetry):
+    """Aporte al índice en base 3 de cada byte de una máscara ya transformada por la simetría"""
+    tables = []
+    for offset in (0, 8):
+        table = []
+        for byte in range(256):
+            index = 0
+            for bit in range(8):
+                if byte >> bit & 1:
+                    i, j = divmod(offset + bit, BOARD_SIZE)
+                    ti, tj = symmetry(i, j)
+                    index += 3 ** (ti * BOARD_SIZE + tj)
+            table.append(index)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+BASE3_TABLES = tuple(_base3_byte_tables(symmetry) for symmetry in SYMMETRIES)
+
+def canonical_index(x, o):
+    """Menor índice en base 3 entre las 8 simetrías de la posición (x, o)"""
+    best = TABLE_ENTRIES
+    for low, high in BASE3_TABLES:
+        index = low[x & 0xFF] + high[x >> 8] + 2 * (low[o & 0xFF] + high[o >> 8])
+        if index < best:
+            best = index
+    return best
+
+def read_value(table, x, o):
+    """Valor de la posición para el jugador en turno (UNKNOWN si no está en la tabla)"""
+    index = canonical_index(x, o)
+    return table[index >> 2] >> ((index & 3) * 2) & 3
+
+def solve_game():
+    """
+    Recorre todas las posiciones alcanzables desde el tablero vacío y calcula su
+    valor exacto. Regresa la tabla como bytearray de TABLE_ENTRIES / 4 bytes.
+    """
+    table = bytearray((TABLE_ENTRIES + 3) // 4)
+
+    def solve(x, o):
+        index = canonical_index(x, o)
+        value = table[index >> 2] >> ((index & 3) * 2) & 3
+        if value != UNKNOWN:
+            return value
+
+        x_to_move = bin(x).count('1') == bin(o).count('1')
+        mover, waiting = (x, o) if x_to_move else (o, x)
+        if is_winner(waiting):
+            value = LOSS
+        elif x | o == FULL_BOARD:
+            value = DRAW
+        else:
+            value = LOSS
+            empty = FULL_BOARD & ~(x | o)
+            # Se visitan todas las jugadas, aunque ya se sepa que se gana, para llenar la tabla
+            while empty:
+                bit = empty & -empty
+                empty ^= bit
+                child = solve(x | bit, o) if x_to_move else solve(x, o | bit)
+                # Lo que es derrota para el rival es victoria para quien mueve
+                value = max(value, WIN + LOSS - child)
+        table[index >> 2] |= value << ((index & 3) * 2)
+        return value
+
+    solve(0, 0)
+    return table
+
+def load_solved_table(path=SOLVED_TABLE_PATH, build=False):
+    """
+    Mapea en memoria la tabla de la solución. Si no existe la construye cuando
+    build=True (tarda varios minutos) y si no, regresa None.
+    """
+    if not os.path.exists(path):
+        if not build:
+            return None
+        table = solve_game()
+        with open(path + ".tmp", "wb") as file:
+            file.write(table)
+        os.replace(path + ".tmp", path)
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+def perfect_move(board, table):
+    """
+    Jugada perfecta (fila, columna) para quien esté en turno según la tabla resuelta:
+    gana si se puede (de inmediato si es posible), si no empata. None si no hay jugadas.
+    """
+    x = board_to_mask(board, 'X')
+    o = board_to_mask(board, 'O')
+    x_to_move = bin(x).count('1') == bin(o).count('1')
+    empty = FULL_BOARD & ~(x | o)
+
+    best, best_rank = None, None
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        child_x, child_o = (x | bit, o) if x_to_move else (x, o | bit)
+        if is_winner(child_x if x_to_move else child_o):
+            return divmod(bit.bit_length() - 1, BOARD_SIZE)
+        child_value = read_value(table, child_x, child_o)
+        rank = WIN + LOSS - child_value if child_value != UNKNOWN else UNKNOWN
+        if best_rank is None or rank > best_rank:
+            best, best_rank = bit, rank
+    if best is None:
+        return None
+    return divmod(best.bit_length() - 1, BOARD_SIZE)
+
+
+if __name__ == "__main__":
+    # python gato_engine.py  ->  resuelve el juego y guarda la tabla junto a este archivo
+    path = sys.argv[1] if len(sys.argv) > 1 else SOLVED_TABLE_PATH
+    start = time.perf_counter()
+    load_solved_table(path, build=True)
+    print(f"Tabla guardada en {path} ({time.perf_counter() - start:.1f} s)")
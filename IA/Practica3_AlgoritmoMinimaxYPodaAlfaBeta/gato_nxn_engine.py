@@ -0,0 +1,175 @@
+"""
+Motor de gato generalizado: tablero de N x N donde gana quien junte K en línea.
+
+Las líneas posibles (todas las ventanas de K casillas en filas, columnas y ambas
+diagonales) se precalculan al crear el juego. Para cada línea se lleva la cuenta
+de fichas de cada jugador y la evaluación heurística se actualiza de forma
+incremental en cada jugada, así los nodos donde corta la profundidad reciben una
+puntuación útil en lugar de 0.
+"""
+import math
+
+# Profundidad por defecto de la búsqueda, suficiente para 5x5 y 6x6 a velocidad interactiva
+DEFAULT_MAX_DEPTH = 3
+
+
+def build_lines(size, k):
+    """Todas las ventanas de k casillas en línea recta, como tuplas de índices fila * size + columna"""
+    lines = []
+    for i in range(size):
+        for j in range(size):
+            for di, dj in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_i, end_j = i + di * (k - 1), j + dj * (k - 1)
+                if 0 <= end_i < size and 0 <= end_j < size:
+                    lines.append(tuple((i + di * step) * size + j + dj * step for step in range(k)))
+    return lines
+
+
+class GameNxN:
+    """
+    Estado del juego con cuentas por línea. make_move/undo_move mantienen la
+    evaluación y detectan al ganador revisando solo las líneas de la casilla jugada.
+    """
+    def __init__(self, size=4, k=None, ai_player='O', human_player='X'):
+        self.size = size
+        self.k = k or size
+        self.ai_player = ai_player
+        self.human_player = human_player
+        self.lines = build_lines(size, self.k)
+        self.cell_lines = [[] for _ in range(size * size)]
+        for line_id, line in enumerate(self.lines):
+            for cell in line:
+                self.cell_lines[cell].append(line_id)
+
+        # Una línea con c fichas de un solo jugador vale 10**(c - 1) para él
+        self.weights = [0] + [10 ** (count - 1) for count in range(1, self.k)]
+        # Una victoria vale más que cualquier suma de amenazas
+        self.win_score = 10 ** self.k * max(1, len(self.lines))
+
+        self.cells = [''] * (size * size)
+        self.ai_counts = [0] * len(self.lines)
+        self.human_counts = [0] * len(self.lines)
+        self.evaluation = 0
+        self.winner = None
+        self.complete_lines = {ai_player: 0, human_player: 0}
+        self.moves_made = 0
+        # Se prueban primero las casillas que pertenecen a más líneas (las del centro)
+        self.move_order = sorted(range(size * size), key=lambda cell: -len(self.cell_lines[cell]))
+
+    @classmethod
+    def from_board(cls, board, k=None, ai_player='O', human_player='X'):
+        """Crea el juego a partir de una lista de listas con 'X', 'O' o ''"""
+        game = cls(len(board), k, ai_player, human_player)
+        for i, row in enumerate(board):
+            for j, cell in enumerate(row):
+                if cell:
+                    game.make_move(i * game.size + j, cell)
+        return game
+
+    def line_value(self, ai_count, human_count):
+        if ai_count and human_count:
+            return 0
+        if ai_count:
+            return self.weights[ai_count] if ai_count < self.k else 0
+        if human_count:
+            return -self.weights[human_count] if human_count < self.k else 0
+        return 0
+
+    def make_move(self, cell, player):
+        self.cells[cell] = player
+        self.moves_made += 1
+        counts = self.ai_counts if player == self.ai_player else self.human_counts
+        for line_id in self.cell_lines[cell]:
+            before = self.line_value(self.ai_counts[line_id], self.human_counts[line_id])
+            counts[line_id] += 1
+            if counts[line_id] == self.k:
+                self.winner = player
+                self.complete_lines[player] += 1
+            self.evaluation += self.line_value(self.ai_counts[line_id], self.human_counts[line_id]) - before
+
+    def undo_move(self, cell):
+        player = self.cells[cell]
+        counts = self.ai_counts if player == self.ai_player else self.human_counts
+        for line_id in self.cell_lines[cell]:
+            before = self.line_value(self.ai_counts[line_id], self.human_counts[line_id])
+            if counts[line_id] == self.k:
+                self.complete_lines[player] -= 1
+            counts[line_id] -= 1
+            self.evaluation += self.line_value(self.ai_counts[line_id], self.human_counts[line_id]) - before
+        self.cells[cell] = ''
+        self.moves_made -= 1
+        # El ganador solo cambia si esta jugada completaba sus únicas líneas ganadoras
+        # (un tablero cargado con from_board puede traer un ganador de antes)
+        if self.winner == player and not self.complete_lines[player]:
+            other = self.human_player if player == self.ai_player else self.ai_player
+            self.winner = other if self.complete_lines[other] else None
+
+    def is_full(self):
+        return self.moves_made == len(self.cells)
+
+    def winning_lines(self, player):
+        """Líneas completas del jugador (para resaltarlas en una GUI)"""
+        counts = self.ai_counts if player == self.ai_player else self.human_counts
+        return [self.lines[line_id] for line_id, count in enumerate(counts) if count == self.k]
+
+    def minimax(self, depth, is_maximizing, alpha, beta, max_depth, observer=None):
+        """
+        Minimax con poda Alfa-Beta; al llegar a max_depth regresa la evaluación heurística.
+        `observer` recibe los eventos de la búsqueda (ver IA/instrumentacion.py).
+        """
+        if self.winner == self.ai_player:
+            return self.win_score - depth
+        if self.winner == self.human_player:
+            return depth - self.win_score
+        if self.is_full():
+            return 0
+        if depth > max_depth:
+            return self.evaluation
+
+        if observer is not None:
+            observer.expandir(tuple(self.cells))
+        player = self.ai_player if is_maximizing else self.human_player
+        best_eval = -math.inf if is_maximizing else math.inf
+        for cell in self.move_order:
+            if self.cells[cell]:
+                continue
+            self.make_move(cell, player)
+            if observer is not None:
+                observer.generar(cell)
+            evaluation = self.minimax(depth + 1, not is_maximizing, alpha, beta, max_depth, observer)
+            self.undo_move(cell)
+            if is_maximizing:
+                best_eval = max(best_eval, evaluation)
+                alpha = max(alpha, evaluation)
+            else:
+                best_eval = min(best_eval, evaluation)
+                beta = min(beta, evaluation)
+            if beta <= alpha:
+                if observer is not None:
+                    observer.podar(cell)
+                break
+        return best_eval
+
+    def best_move(self, max_depth=DEFAULT_MAX_DEPTH, observer=None):
+        """Regresa la mejor casilla (fila, columna) para la IA, o None si no hay jugadas o ya hay ganador"""
+        if self.winner is not None:
+            return None
+        best_score, best = -math.inf, None
+        alpha = -math.inf
+        for cell in self.move_order:
+            if self.cells[cell]:
+                continue
+            self.make_move(cell, self.ai_player)
+            score = self.minimax(0, False, alpha, math.inf, max_depth, observer)
+            self.undo_move(cell)
+            if score > best_score:
+                best_score, best = score, cell
+            alpha = max(alpha, score)
+        if best is None:
+            return None
+        return divmod(best, self.size)
+
+
+def best_move(board, k=None, ai_player='O', human_player='X', max_depth=DEFAULT_MAX_DEPTH, observer=None):
+    """Mejor jugada (fila, columna) de ai_player en un tablero de cualquier tamaño con k en línea"""
+    return GameNxN.from_board(board, k, ai_player, human_player).best_move(max_depth, observer)
@@ -0,0 +1,295 @@
+"""
+Banco de pruebas sin interfaz para los algoritmos de búsqueda de las prácticas.
+
+Corre cada algoritmo sobre un corpus reproducible (generado con una semilla fija)
+y reporta en JSON el tiempo, los nodos expandidos, la memoria pico y los nodos por
+segundo, para poder comparar versiones y detectar regresiones.
+
+Uso:
+    python benchmark.py [--semilla 2024] [--salida resultados.json] [--sin-memoria]
+"""
+import argparse
+import functools
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from instrumentacion import Estadisticas
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RUTA_PUZZLE = os.path.join(DIRECTORIO, "Practica 2", "15-puzzle", "15puzzle.py")
+RUTA_LABERINTO = os.path.join(DIRECTORIO, "Practica 2", "Laberinto", "dfs.py")
+RUTA_MOTOR_GATO = os.path.join(DIRECTORIO, "Practica3_AlgoritmoMinimaxYPodaAlfaBeta", "gato_engine.py")
+# Tablas precalculadas que genera el banco (el perímetro del 15-puzzle), fuera del árbol de fuentes
+DIRECTORIO_CACHE = os.path.join(tempfile.gettempdir(), "escom_benchmark")
+
+# Profundidades de revoltura del 15-puzzle y tableros por profundidad
+PROFUNDIDADES_PUZZLE = (10, 20, 30, 40)
+TABLEROS_POR_PROFUNDIDAD = 3
+# Celdas por lado (sin contar muros) de los laberintos generados
+TAMANOS_LABERINTO = (10, 20, 40, 80)
+# Presupuesto de tiempo de la profundización iterativa del gato
+PRESUPUESTO_GATO_MS = 500
+# Profundidad de la comparación entre minimax serial y paralelo en la raíz
+PROFUNDIDAD_PARALELA = 6
+# Procesos con los que se corre la búsqueda paralela; la aceleración es contra 1 proceso
+PROCESOS_PARALELOS = sorted({1, 2, os.cpu_count() or 1})
+# Posiciones fijas del gato 4x4, siempre con turno de la IA (O)
+POSICIONES_GATO = {
+    'apertura': ("X...",
+                 "....",
+                 "....",
+                 "...."),
+    'medio_juego': ("X..O",
+                    ".X..",
+                    "..O.",
+                    "X..."),
+    'final': ("XOX.",
+              "OXO.",
+              "X.OX",
+              "...."),
+}
+
+
+def cargar_modulo(nombre, ruta):
+    """Importa un script por ruta (los nombres de archivo no siempre son importables)"""
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+# ------------------------------------------------------------------------
+# GENERACIÓN DEL CORPUS
+# ------------------------------------------------------------------------
+
+def revolver_puzzle(puzzle, profundidad, generador):
+    """Camina `profundidad` movimientos al azar desde ESTADO_FINAL sin deshacer el anterior"""
+    codigo, vacia, vacia_previa = puzzle.CODIGO_FINAL, puzzle.posicion_vacia_empaquetada(puzzle.CODIGO_FINAL), None
+    for _ in range(profundidad):
+        opciones = [(c, v) for c, v in puzzle.obtener_siguientes_empaquetados(codigo, vacia) if v != vacia_previa]
+        vacia_previa = vacia
+        codigo, vacia = generador.choice(opciones)
+    return puzzle.desempaquetar_estado(codigo)
+
+def generar_laberinto(celdas, generador):
+    """
+    Laberinto perfecto de (2 * celdas + 1) de lado tallado con DFS aleatorio.
+    'I' queda en la esquina superior izquierda y 'F' en la inferior derecha.
+    """
+    lado = 2 * celdas + 1
+    laberinto = [['#'] * lado for _ in range(lado)]
+    laberinto[1][1] = ' '
+    pila = [(1, 1)]
+    while pila:
+        fila, columna = pila[-1]
+        vecinos = [(fila + df, columna + dc) for df, dc in ((0, 2), (2, 0), (0, -2), (-2, 0))
+                   if 0 < fila + df < lado and 0 < columna + dc < lado and laberinto[fila + df][columna + dc] == '#']
+        if not vecinos:
+            pila.pop()
+            continue
+        nueva_fila, nueva_columna = generador.choice(vecinos)
+        laberinto[(fila + nueva_fila) // 2][(columna + nueva_columna) // 2] = ' '
+        laberinto[nueva_fila][nueva_columna] = ' '
+        pila.append((nueva_fila, nueva_columna))
+    laberinto[1][1] = 'I'
+    laberinto[lado - 2][lado - 2] = 'F'
+    return laberinto
+
+def tablero_gato(filas):
+    return [['' if celda == '.' else celda for celda in fila] for fila in filas]
+
+
+# ------------------------------------------------------------------------
+# MEDICIÓN
+# ------------------------------------------------------------------------
+
+def medir(funcion, medir_memoria):
+    """
+    Corre `funcion` (que regresa un dict con al menos 'nodos') y agrega tiempo,
+    nodos por segundo y, opcionalmente, memoria pico en una segunda corrida con
+    tracemalloc para que su costo no contamine el tiempo.
+    """
+    inicio = time.perf_counter()
+    try:
+        registro = funcion()
+    except RecursionError:
+        return {'error': 'RecursionError'}
+    tiempo = time.perf_counter() - inicio
+    registro['tiempo'] = tiempo
+    registro['nodos_por_segundo'] = registro['nodos'] / tiempo if tiempo > 0 else None
+    if medir_memoria:
+        tracemalloc.start()
+        funcion()
+        registro['memoria_pico'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return registro
+
+def bench_puzzle(puzzle, generador, medir_memoria):
+    os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+    algoritmos = {
+        'a_estrella': puzzle.resolver_con_a_estrella,
+        'a_estrella_empaquetado': puzzle.resolver_con_a_estrella_empaquetado,
+        'ida_estrella': puzzle.resolver_con_ida_estrella,
+        'a_estrella_bidireccional': puzzle.resolver_con_a_estrella_bidireccional,
+        # El perímetro se construye o mapea aquí, fuera de la medición
+        'a_estrella_perimetro': functools.partial(puzzle.resolver_con_a_estrella_empaquetado,
+                                                  perimetro=puzzle.cargar_perimetro(directorio=DIRECTORIO_CACHE)),
+    }
+    resultados = []
+    for profundidad in PROFUNDIDADES_PUZZLE:
+        for numero in range(TABLEROS_POR_PROFUNDIDAD):
+            estado = revolver_puzzle(puzzle, profundidad, generador)
+            for nombre, algoritmo in algoritmos.items():
+                def correr(algoritmo=algoritmo, estado=estado):
+                    camino, _, estados_explorados = algoritmo(estado)
+                    return {'nodos': estados_explorados, 'longitud': len(camino) - 1 if camino else None}
+                registro = {'suite': '15puzzle', 'algoritmo': nombre, 'caso': f"revoltura_{profundidad}_{numero}"}
+                registro.update(medir(correr, medir_memoria))
+                resultados.append(registro)
+    return resultados
+
+def bench_laberinto(laberinto_mod, generador, medir_memoria):
+    def dfs(laberinto):
+        inicio, _ = laberinto_mod.encontrar_puntos(laberinto)
+        camino, nodos = laberinto_mod.buscar_camino_dfs(laberinto, inicio)
+        return {'nodos': nodos, 'longitud': len(camino) - 1 if camino else None}
+
+    def bfs(laberinto):
+        inicio, _ = laberinto_mod.encontrar_puntos(laberinto)
+        camino, nodos = laberinto_mod.buscar_camino_bfs(laberinto, inicio)
+        return {'nodos': nodos, 'longitud': len(camino) - 1 if camino else None}
+
+    def bfs_bidireccional(laberinto):
+        inicio, fin = laberinto_mod.encontrar_puntos(laberinto)
+        camino, nodos = laberinto_mod.buscar_camino_bfs_bidireccional(laberinto, inicio, fin)
+        return {'nodos': nodos, 'longitud': len(camino) - 1 if camino else None}
+
+    def a_estrella(laberinto):
+        inicio, fin = laberinto_mod.encontrar_puntos(laberinto)
+        camino, nodos = laberinto_mod.buscar_camino_a_estrella(laberinto, inicio, fin)
+        return {'nodos': nodos, 'longitud': len(camino) - 1 if camino else None}
+
+    def jps(laberinto):
+        inicio, fin = laberinto_mod.encontrar_puntos(laberinto)
+        camino, nodos = laberinto_mod.buscar_camino_jps(laberinto, inicio, fin)
+        return {'nodos': nodos, 'longitud': len(camino) - 1 if camino else None}
+
+    algoritmos = {'dfs': dfs, 'bfs': bfs, 'bfs_bidireccional': bfs_bidireccional, 'a_estrella': a_estrella, 'jps': jps}
+    resultados = []
+    for celdas in TAMANOS_LABERINTO:
+        laberinto_base = generar_laberinto(celdas, generador)
+        for nombre, algoritmo in algoritmos.items():
+            def correr(algoritmo=algoritmo):
+                return algoritmo(laberinto_base)
+            registro = {'suite': 'laberinto', 'algoritmo': nombre, 'caso': f"{2 * celdas + 1}x{2 * celdas + 1}"}
+            registro.update(medir(correr, medir_memoria))
+            resultados.append(registro)
+    return resultados
+
+def minimax_contado(motor, tablero, profundidad, tabla=None):
+    """best_move del motor de bits contando los nodos expandidos con un observador"""
+    estadisticas = Estadisticas()
+    jugada = motor.best_move(tablero, max_depth=profundidad, table=tabla, observer=estadisticas)
+    return {'nodos': estadisticas.expandidos, 'jugada': jugada}
+
+def bench_gato(motor, medir_memoria):
+    def minimax_bits(filas, usar_tabla):
+        tabla = motor.TranspositionTable() if usar_tabla else None
+        return minimax_contado(motor, tablero_gato(filas), motor.MAX_DEPTH, tabla)
+
+    def profundizacion_iterativa(filas):
+        tablero = tablero_gato(filas)
+        busqueda = motor.IterativeDeepeningSearch(PRESUPUESTO_GATO_MS, motor.TranspositionTable())
+        bit, profundidad = busqueda.best_move(motor.board_to_mask(tablero, 'O'), motor.board_to_mask(tablero, 'X'))
+        return {'nodos': busqueda.nodes, 'jugada': divmod(bit.bit_length() - 1, 4), 'profundidad': profundidad}
+
+    resultados = []
+    for caso, filas in POSICIONES_GATO.items():
+        registro = {'suite': 'gato4x4', 'algoritmo': 'profundizacion_iterativa', 'caso': caso}
+        registro.update(medir(lambda filas=filas: profundizacion_iterativa(filas), medir_memoria))
+        resultados.append(registro)
+        for nombre, usar_tabla in (('minimax', False), ('minimax_transposicion', True)):
+            registro = {'suite': 'gato4x4', 'algoritmo': nombre, 'caso': caso}
+            registro.update(medir(lambda filas=filas, usar_tabla=usar_tabla: minimax_bits(filas, usar_tabla), medir_memoria))
+            resultados.append(registro)
+    return resultados
+
+
+def bench_gato_paralelo(motor):
+    """
+    Tiempo de ParallelRootSearch con distinto número de procesos contra best_move
+    serial a la misma profundidad. La aceleración se calcula contra el mismo código
+    con 1 proceso, así que solo mide el reparto entre núcleos. Sin tracemalloc:
+    la memoria de los procesos hijos no se vería.
+    """
+    resultados = []
+    for caso, filas in POSICIONES_GATO.items():
+        tablero = tablero_gato(filas)
+        serial = {'suite': 'gato4x4_paralelo', 'algoritmo': 'minimax_serial', 'caso': caso, 'procesos': 1}
+        serial.update(medir(lambda: minimax_contado(motor, tablero, PROFUNDIDAD_PARALELA), False))
+        resultados.append(serial)
+        tiempo_un_proceso = None
+        for procesos in PROCESOS_PARALELOS:
+            with motor.ParallelRootSearch(procesos) as busqueda:
+                # Arranca los procesos del pool fuera de la medición
+                busqueda.best_move(tablero, max_depth=0)
+                busqueda.table.clear()
+
+                def correr(busqueda=busqueda):
+                    jugada = busqueda.best_move(tablero, max_depth=PROFUNDIDAD_PARALELA)
+                    return {'nodos': busqueda.nodes, 'jugada': jugada}
+                registro = {'suite': 'gato4x4_paralelo', 'algoritmo': 'minimax_paralelo', 'caso': caso,
+                            'procesos': procesos}
+                registro.update(medir(correr, False))
+            if procesos == 1:
+                tiempo_un_proceso = registro['tiempo']
+            registro['aceleracion'] = tiempo_un_proceso / registro['tiempo'] if registro['tiempo'] > 0 else None
+            registro['misma_jugada'] = registro['jugada'] == serial['jugada']
+            resultados.append(registro)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--semilla', type=int, default=2024, help="semilla del corpus")
+    parser.add_argument('--salida', help="archivo JSON de salida (por defecto stdout)")
+    parser.add_argument('--sin-memoria', action='store_true', help="omite la corrida con tracemalloc")
+    args = parser.parse_args()
+
+    puzzle = cargar_modulo('puzzle15', RUTA_PUZZLE)
+    laberinto = cargar_modulo('laberinto', RUTA_LABERINTO)
+    motor_gato = cargar_modulo('gato_engine', RUTA_MOTOR_GATO)
+
+    generador = random.Random(args.semilla)
+    medir_memoria = not args.sin_memoria
+    resultados = []
+    resultados += bench_puzzle(puzzle, generador, medir_memoria)
+    resultados += bench_laberinto(laberinto, generador, medir_memoria)
+    resultados += bench_gato(motor_gato, medir_memoria)
+    resultados += bench_gato_paralelo(motor_gato)
+
+    reporte = {
+        'semilla': args.semilla,
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'resultados': resultados,
+    }
+    if args.salida:
+        with open(args.salida, 'w') as archivo:
+            json.dump(reporte, archivo, indent=2)
+    else:
+        json.dump(reporte, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Observadores para instrumentar los algoritmos de búsqueda de las prácticas.
+
+Los solvers aceptan un parámetro opcional `observador` y, solo si no es None,
+lo llaman en tres puntos:
+
+    expandir(nodo, frontera=None, cerrados=None)  al sacar un nodo para expandirlo
+    generar(nodo)                                 por cada sucesor generado
+    podar(nodo=None)                              al descartar trabajo (corte alfa-beta,
+                                                  límite de IDA*, entrada obsoleta)
+
+Quien lanza la búsqueda llama terminar() al acabar. `frontera` y `cerrados` son
+las estructuras del propio solver (cola, heap, diccionario de visitados...); se
+guardan por referencia y solo se miden al tomar una instantánea, así que la
+instrumentación apagada no cuesta nada más que la comparación con None.
+
+Uso:
+    estadisticas = Estadisticas(intervalo=1.0, ruta_traza='traza.jsonl')
+    resolver_con_a_estrella_empaquetado(estado, observador=estadisticas)
+    print(estadisticas.instantanea())
+"""
+import json
+import sys
+import time
+
+# Cada cuántos eventos se revisa el reloj para decidir si toca una instantánea
+EVENTOS_POR_REVISION = 1024
+
+
+class Observador:
+    """Observador que no hace nada; sirve de base para los demás"""
+    def expandir(self, nodo, frontera=None, cerrados=None):
+        pass
+
+    def generar(self, nodo):
+        pass
+
+    def podar(self, nodo=None):
+        pass
+
+    def terminar(self):
+        pass
+
+
+class Estadisticas(Observador):
+    """
+    Cuenta nodos expandidos, generados y podados y toma instantáneas periódicas con
+    nodos por segundo, tamaño de la frontera (y su máximo), memoria aproximada del
+    conjunto de cerrados, factor de ramificación y tasa de podas.
+
+    Cada `intervalo` segundos la instantánea se entrega a `al_tomar_instantanea`
+    (si se da) y se escribe como una línea JSON en `ruta_traza` (si se da).
+    """
+    def __init__(self, intervalo=1.0, ruta_traza=None, al_tomar_instantanea=None):
+        self.intervalo = intervalo
+        self.al_tomar_instantanea = al_tomar_instantanea
+        self.traza = open(ruta_traza, 'w') if ruta_traza else None
+        self.expandidos = 0
+        self.generados = 0
+        self.podas = 0
+        self.frontera_maxima = 0
+        self.instantaneas = []
+        self._frontera = None
+        self._cerrados = None
+        self._eventos = 0
+        self._inicio = time.perf_counter()
+        self._ultima = self._inicio
+        self._expandidos_ultima = 0
+
+    def expandir(self, nodo, frontera=None, cerrados=None):
+        self.expandidos += 1
+        if frontera is not None:
+            self._frontera = frontera
+        if cerrados is not None:
+            self._cerrados = cerrados
+        self._contar_evento()
+
+    def generar(self, nodo):
+        self.generados += 1
+        self._contar_evento()
+
+    def podar(self, nodo=None):
+        self.podas += 1
+        self._contar_evento()
+
+    def _contar_evento(self):
+        self._eventos += 1
+        if self._eventos % EVENTOS_POR_REVISION == 0 and self._frontera is not None:
+            self.frontera_maxima = max(self.frontera_maxima, len(self._frontera))
+        if self._eventos % EVENTOS_POR_REVISION == 0 and time.perf_counter() - self._ultima >= self.intervalo:
+            self._registrar(self.instantanea())
+
+    def instantanea(self):
+        """
+        Estado actual de las estadísticas como diccionario. Los nodos por segundo se
+        miden desde la última instantánea registrada; consultarla no reinicia la ventana.
+        """
+        ahora = time.perf_counter()
+        transcurrido = ahora - self._inicio
+        tramo = ahora - self._ultima
+        tamano_frontera = len(self._frontera) if self._frontera is not None else None
+        if tamano_frontera is not None:
+            self.frontera_maxima = max(self.frontera_maxima, tamano_frontera)
+        datos = {
+            'tiempo': transcurrido,
+            'expandidos': self.expandidos,
+            'generados': self.generados,
+            'podas': self.podas,
+            'nodos_por_segundo': (self.expandidos - self._expandidos_ultima) / tramo if tramo > 0 else None,
+            'frontera': tamano_frontera,
+            'frontera_maxima': self.frontera_maxima,
+            'cerrados': len(self._cerrados) if self._cerrados is not None else None,
+            # Solo el contenedor (la tabla del diccionario o conjunto), sin contar las llaves
+            'memoria_cerrados': sys.getsizeof(self._cerrados) if self._cerrados is not None else None,
+            'factor_ramificacion': self.generados / self.expandidos if self.expandidos else None,
+            'tasa_podas': self.podas / self.expandidos if self.expandidos else None,
+        }
+        return datos
+
+    def _registrar(self, datos):
+        # La ventana de nodos por segundo avanza solo con las instantáneas registradas,
+        # así consultar instantanea() desde fuera no la altera
+        self._ultima = self._inicio + datos['tiempo']
+        self._expandidos_ultima = datos['expandidos']
+        self.instantaneas.append(datos)
+        if self.al_tomar_instantanea is not None:
+            self.al_tomar_instantanea(datos)
+        if self.traza is not None:
+            self.traza.write(json.dumps(datos) + '\n')
+            self.traza.flush()
+
+    def terminar(self):
+        """Toma la instantánea final y cierra la traza"""
+        self._registrar(self.instantanea())
+        if self.traza is not None:
+            self.traza.close()
+            self.traza = None